@@ -0,0 +1,36 @@
+"""Add program week audit actions
+
+Revision ID: l6m7n8o9p0q1
+Revises: k5l6m7n8o9p0
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'l6m7n8o9p0q1'
+down_revision = 'k5l6m7n8o9p0'
+branch_labels = None
+depends_on = None
+
+
+NEW_ACTIONS = ('program_week_created', 'program_week_approved', 'program_week_locked')
+
+
+def upgrade():
+    conn = op.get_bind()
+    
+    # audit_logs é criada por create_all; sem o tipo ainda, ele já nascerá com os novos valores.
+    type_exists = conn.execute(
+        sa.text("SELECT 1 FROM pg_type WHERE typname = 'auditaction'")
+    ).fetchone()
+    if not type_exists:
+        return
+    
+    for value in NEW_ACTIONS:
+        op.execute(f"ALTER TYPE auditaction ADD VALUE IF NOT EXISTS '{value}'")
+
+
+def downgrade():
+    pass
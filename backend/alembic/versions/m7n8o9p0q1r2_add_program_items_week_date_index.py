@@ -0,0 +1,33 @@
+"""Add (program_week_id, op_date) index to activity program items
+
+Revision ID: m7n8o9p0q1r2
+Revises: l6m7n8o9p0q1
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'm7n8o9p0q1r2'
+down_revision = 'l6m7n8o9p0q1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    
+    table_exists = conn.execute(
+        sa.text("SELECT 1 FROM information_schema.tables WHERE table_name = 'activity_program_items'")
+    ).scalar()
+    
+    if table_exists:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_activity_program_items_week_date "
+            "ON activity_program_items (program_week_id, op_date)"
+        )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_activity_program_items_week_date")
@@ -0,0 +1,33 @@
+"""Add (sector_id, target_date) index to employee daily agendas
+
+Revision ID: n8o9p0q1r2s3
+Revises: m7n8o9p0q1r2
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'n8o9p0q1r2s3'
+down_revision = 'm7n8o9p0q1r2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    
+    table_exists = conn.execute(
+        sa.text("SELECT 1 FROM information_schema.tables WHERE table_name = 'employee_daily_agendas'")
+    ).scalar()
+    
+    if table_exists:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_employee_daily_agendas_sector_date "
+            "ON employee_daily_agendas (sector_id, target_date)"
+        )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_employee_daily_agendas_sector_date")
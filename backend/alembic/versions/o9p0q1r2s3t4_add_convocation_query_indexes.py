@@ -0,0 +1,48 @@
+"""Add composite and partial indexes for convocation queries
+
+Revision ID: o9p0q1r2s3t4
+Revises: n8o9p0q1r2s3
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'o9p0q1r2s3t4'
+down_revision = 'n8o9p0q1r2s3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    
+    table_exists = conn.execute(
+        sa.text("SELECT 1 FROM information_schema.tables WHERE table_name = 'convocations'")
+    ).scalar()
+    
+    if table_exists:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_convocations_employee_date_status "
+            "ON convocations (employee_id, date, status) INCLUDE (total_hours)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_convocations_sector_date_status "
+            "ON convocations (sector_id, date, status)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_convocations_daily_shift_id "
+            "ON convocations (daily_shift_id) WHERE daily_shift_id IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_convocations_pending_deadline "
+            "ON convocations (response_deadline) WHERE status = 'PENDING'"
+        )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_convocations_pending_deadline")
+    op.execute("DROP INDEX IF EXISTS ix_convocations_daily_shift_id")
+    op.execute("DROP INDEX IF EXISTS ix_convocations_sector_date_status")
+    op.execute("DROP INDEX IF EXISTS ix_convocations_employee_date_status")
@@ -0,0 +1,55 @@
+"""Add indexes for daily replan lookups
+
+Revision ID: p0q1r2s3t4u5
+Revises: o9p0q1r2s3t4
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'p0q1r2s3t4u5'
+down_revision = 'o9p0q1r2s3t4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    
+    params_exists = conn.execute(
+        sa.text("SELECT 1 FROM information_schema.tables WHERE table_name = 'sector_operational_parameters'")
+    ).scalar()
+    
+    if params_exists:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_sector_operational_parameters_current "
+            "ON sector_operational_parameters (sector_id) WHERE is_current"
+        )
+    
+    plans_exists = conn.execute(
+        sa.text("SELECT 1 FROM information_schema.tables WHERE table_name = 'housekeeping_schedule_plans'")
+    ).scalar()
+    
+    if plans_exists:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_housekeeping_schedule_plans_sector_range "
+            "ON housekeeping_schedule_plans (sector_id, week_start, week_end)"
+        )
+    
+    suggestions_exists = conn.execute(
+        sa.text("SELECT 1 FROM information_schema.tables WHERE table_name = 'replan_suggestions'")
+    ).scalar()
+    
+    if suggestions_exists:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_replan_suggestions_pending "
+            "ON replan_suggestions (schedule_plan_id, target_date) WHERE is_accepted IS NULL"
+        )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_replan_suggestions_pending")
+    op.execute("DROP INDEX IF EXISTS ix_housekeeping_schedule_plans_sector_range")
+    op.execute("DROP INDEX IF EXISTS ix_sector_operational_parameters_current")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, Time, Text, ForeignKey, JSON, SmallInteger, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, Time, Text, ForeignKey, JSON, SmallInteger, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy import Enum as SQLEnum
@@ -60,6 +60,10 @@ class ActivityProgramItem(Base):
     updated_by = Column(String(100), nullable=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index('ix_activity_program_items_week_date', 'program_week_id', 'op_date'),
+    )
+
     program_week = relationship("ActivityProgramWeek", back_populates="items")
     sector = relationship("Sector")
     activity = relationship("GovernanceActivity")
@@ -38,6 +38,9 @@ class AuditAction(str, enum.Enum):
     SUGGESTION_APPLIED = "suggestion_applied"
     SUGGESTION_IGNORED = "suggestion_ignored"
     ADJUSTMENT_CREATED_FROM_SUGGESTION = "adjustment_created_from_suggestion"
+    PROGRAM_WEEK_CREATED = "program_week_created"
+    PROGRAM_WEEK_APPROVED = "program_week_approved"
+    PROGRAM_WEEK_LOCKED = "program_week_locked"
 
 
 class AuditLog(Base):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, Time, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, Time, Boolean, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -66,3 +66,17 @@ class Convocation(Base):
     daily_shift = relationship("DailyShift", back_populates="convocation")
     weekly_schedule = relationship("WeeklySchedule")
     replaced_convocation = relationship("Convocation", remote_side=[id], foreign_keys=[replaced_convocation_id])
+
+    __table_args__ = (
+        # Carga semanal e conflito no dia (validação de convocação)
+        Index('ix_convocations_employee_date_status', 'employee_id', 'date', 'status',
+              postgresql_include=['total_hours']),
+        # Estatísticas por setor/semana
+        Index('ix_convocations_sector_date_status', 'sector_id', 'date', 'status'),
+        # Turnos já convocados ao gerar a partir da escala
+        Index('ix_convocations_daily_shift_id', 'daily_shift_id',
+              postgresql_where=text('daily_shift_id IS NOT NULL')),
+        # Expiração: só as pendentes entram no índice
+        Index('ix_convocations_pending_deadline', 'response_deadline',
+              postgresql_where=text("status = 'PENDING'")),
+    )
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey, Date, JSON, Text
+from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey, Date, JSON, Text, Index
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.database import Base
 import enum
 
@@ -89,6 +89,12 @@ class SectorOperationalParameters(Base):
 
     sector = relationship("Sector")
 
+    __table_args__ = (
+        # Parâmetros vigentes do setor
+        Index('ix_sector_operational_parameters_current', 'sector_id',
+              postgresql_where=text('is_current')),
+    )
+
 
 class ForecastRun(Base):
     """
@@ -238,6 +244,11 @@ class HousekeepingSchedulePlan(Base):
     baseline_plan = relationship("HousekeepingSchedulePlan", remote_side=[id], foreign_keys=[baseline_plan_id])
     shift_slots = relationship("ShiftSlot", back_populates="schedule_plan", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Escala ativa do setor que cobre uma data
+        Index('ix_housekeeping_schedule_plans_sector_range', 'sector_id', 'week_start', 'week_end'),
+    )
+
 
 class ShiftSlot(Base):
     """
@@ -361,6 +372,12 @@ class ReplanSuggestion(Base):
 
     schedule_plan = relationship("HousekeepingSchedulePlan")
 
+    __table_args__ = (
+        # Sugestões pendentes por escala/data
+        Index('ix_replan_suggestions_pending', 'schedule_plan_id', 'target_date',
+              postgresql_where=text('is_accepted IS NULL')),
+    )
+
 
 class ForecastRunSectorSnapshot(Base):
     """
@@ -433,7 +450,11 @@ class EmployeeDailyAgenda(Base):
     shift_slot = relationship("ShiftSlot")
     employee = relationship("Employee")
     sector = relationship("Sector")
-    items = relationship("EmployeeDailyAgendaItem", back_populates="agenda", cascade="all, delete-orphan", order_by="EmployeeDailyAgendaItem.order")
+    items = relationship("EmployeeDailyAgendaItem", back_populates="agenda", cascade="all, delete-orphan", passive_deletes=True, order_by="EmployeeDailyAgendaItem.order")
+
+    __table_args__ = (
+        Index('ix_employee_daily_agendas_sector_date', 'sector_id', 'target_date'),
+    )
 
 
 class EmployeeDailyAgendaItem(Base):
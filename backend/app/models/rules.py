@@ -2,6 +2,26 @@ from sqlalchemy import Column, Integer, Float, Boolean, String, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+import copy
+
+
+DEFAULT_SHIFT_TEMPLATES = {
+    "morning": {"start": "07:00", "end": "15:00"},
+    "afternoon": {"start": "14:00", "end": "22:00"}
+}
+
+DEFAULT_PRODUCTIVITY_PARAMS = {
+    "tempo_checkout": 25.0,
+    "tempo_estada": 10.0,
+    "jornada_media_horas": 8.0
+}
+
+DEFAULT_INDICATORS = {
+    "fator_feriado": 1.1,
+    "fator_vespera_feriado": 1.05,
+    "fator_pico": 1.2,
+    "fator_baixa_ocupacao": 0.9
+}
 
 
 class LaborRules(Base):
@@ -54,23 +74,9 @@ class SectorOperationalRules(Base):
     utilization_target_pct = Column(Float, default=85.0)
     buffer_pct = Column(Float, default=10.0)
     
-    shift_templates_json = Column(JSON, nullable=True, default=lambda: {
-        "morning": {"start": "07:00", "end": "15:00"},
-        "afternoon": {"start": "14:00", "end": "22:00"}
-    })
-    
-    productivity_params_json = Column(JSON, nullable=True, default=lambda: {
-        "tempo_checkout": 25.0,
-        "tempo_estada": 10.0,
-        "jornada_media_horas": 8.0
-    })
-    
-    indicators_json = Column(JSON, nullable=True, default=lambda: {
-        "fator_feriado": 1.1,
-        "fator_vespera_feriado": 1.05,
-        "fator_pico": 1.2,
-        "fator_baixa_ocupacao": 0.9
-    })
+    shift_templates_json = Column(JSON, nullable=True, default=lambda: copy.deepcopy(DEFAULT_SHIFT_TEMPLATES))
+    productivity_params_json = Column(JSON, nullable=True, default=lambda: dict(DEFAULT_PRODUCTIVITY_PARAMS))
+    indicators_json = Column(JSON, nullable=True, default=lambda: dict(DEFAULT_INDICATORS))
     
     alternancia_horarios = Column(Boolean, default=True)
     alternancia_atividades = Column(Boolean, default=True)
@@ -12,6 +12,10 @@ class DayType(str, enum.Enum):
     VESPERA_FERIADO = "vespera_feriado"
 
 
+DIAS_SEMANA = ("seg", "ter", "qua", "qui", "sex", "sab", "dom")
+CAMPOS_DIA = ("ocupacao_prevista", "quartos_vagos_sujos", "quartos_estada", "tipo_dia")
+
+
 class WeeklyParameters(Base):
     """
     Parâmetros operacionais da semana para cálculo de mão de obra.
@@ -74,3 +78,20 @@ class WeeklyParameters(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     sector = relationship("Sector")
+
+    @property
+    def days(self) -> list:
+        """Parâmetros dos 7 dias (segunda a domingo), um dict por dia."""
+        return [
+            {campo: getattr(self, f"{dia}_{campo}") for campo in CAMPOS_DIA}
+            for dia in DIAS_SEMANA
+        ]
+
+    @days.setter
+    def days(self, valores: list) -> None:
+        """Grava os dias informados nas colunas; entradas None mantêm o dia inalterado."""
+        for dia, valores_dia in zip(DIAS_SEMANA, valores):
+            if valores_dia is None:
+                continue
+            for campo, valor in valores_dia.items():
+                setattr(self, f"{dia}_{campo}", valor)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import date, datetime
 
@@ -18,12 +18,20 @@ from app.schemas.convocation import (
 router = APIRouter(prefix="/api/convocations", tags=["convocations"])
 
 
-def _convocation_to_response(conv: Convocation, db: Session) -> dict:
-    employee = db.query(Employee).filter(Employee.id == conv.employee_id).first()
-    sector = db.query(Sector).filter(Sector.id == conv.sector_id).first()
-    activity = None
-    if conv.activity_id:
-        activity = db.query(GovernanceActivity).filter(GovernanceActivity.id == conv.activity_id).first()
+def _with_related(query):
+    """Carrega colaborador, setor e atividade junto com as convocações (evita N+1)."""
+    return query.options(
+        joinedload(Convocation.employee).load_only(Employee.id, Employee.name),
+        joinedload(Convocation.sector).load_only(Sector.id, Sector.name),
+        joinedload(Convocation.activity).load_only(GovernanceActivity.id, GovernanceActivity.name)
+    )
+
+
+def _convocation_to_response(conv: Convocation) -> dict:
+    # Relacionamentos many-to-one: se já estiverem na sessão, não geram query
+    employee = conv.employee
+    sector = conv.sector
+    activity = conv.activity
     
     return {
         "id": conv.id,
@@ -69,7 +77,7 @@ def list_convocations(
     week_start: Optional[date] = Query(None),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Convocation)
+    query = _with_related(db.query(Convocation))
     
     if sector_id:
         query = query.filter(Convocation.sector_id == sector_id)
@@ -92,7 +100,7 @@ def list_convocations(
     
     convocations = query.order_by(Convocation.date.desc(), Convocation.created_at.desc()).all()
     
-    return [_convocation_to_response(c, db) for c in convocations]
+    return [_convocation_to_response(c) for c in convocations]
 
 
 @router.get("/stats", response_model=ConvocationStats)
@@ -107,10 +115,10 @@ def get_stats(
 
 @router.get("/{convocation_id}", response_model=dict)
 def get_convocation(convocation_id: int, db: Session = Depends(get_db)):
-    convocation = db.query(Convocation).filter(Convocation.id == convocation_id).first()
+    convocation = _with_related(db.query(Convocation)).filter(Convocation.id == convocation_id).first()
     if not convocation:
         raise HTTPException(status_code=404, detail="Convocação não encontrada")
-    return _convocation_to_response(convocation, db)
+    return _convocation_to_response(convocation)
 
 
 @router.post("/", response_model=dict)
@@ -150,7 +158,7 @@ def create_convocation(data: ConvocationCreate, db: Session = Depends(get_db)):
         })
     
     db.commit()
-    return _convocation_to_response(convocation, db)
+    return _convocation_to_response(convocation)
 
 
 @router.post("/{convocation_id}/respond", response_model=dict)
@@ -177,7 +185,7 @@ def respond_to_convocation(
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["error"])
     
-    response = _convocation_to_response(result["convocation"], db)
+    response = _convocation_to_response(result["convocation"])
     
     if "reschedule_result" in result and result["reschedule_result"]:
         response["reschedule_result"] = result["reschedule_result"]
@@ -200,7 +208,7 @@ def cancel_convocation(
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["error"])
     
-    return _convocation_to_response(result["convocation"], db)
+    return _convocation_to_response(result["convocation"])
 
 
 @router.post("/generate-from-schedule", response_model=GenerateConvocationsResponse)
@@ -248,11 +256,11 @@ def get_employee_convocation_history(
     if not employee:
         raise HTTPException(status_code=404, detail="Colaborador não encontrado")
     
-    convocations = db.query(Convocation).filter(
+    convocations = _with_related(db.query(Convocation)).filter(
         Convocation.employee_id == employee_id
     ).order_by(Convocation.date.desc()).limit(limit).all()
     
-    return [_convocation_to_response(c, db) for c in convocations]
+    return [_convocation_to_response(c) for c in convocations]
 
 
 @router.post("/validate", response_model=dict)
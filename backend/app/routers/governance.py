@@ -15,7 +15,7 @@ from app.models.sector import Sector
 from app.services.governance_forecast_service import GovernanceForecastService
 from app.services.governance_demand_service import GovernanceDemandService
 from app.services.governance_schedule_generator import GovernanceScheduleGenerator
-from app.services.daily_replan_service import DailyReplanService
+from app.services.daily_replan_service import DailyReplanService, invalidate_sector_parameters_cache
 from app.services.turnover_stats_service import TurnoverStatsService
 from app.services.recurrence_expansion_service import (
     expand_recurring_activities,
@@ -145,6 +145,7 @@ def create_parameters(data: ParametersCreate, db: Session = Depends(get_db)):
     db.add(params)
     db.commit()
     db.refresh(params)
+    invalidate_sector_parameters_cache(data.sector_id)
     
     return {"success": True, "id": params.id, "message": "Parâmetros criados com sucesso"}
 
@@ -169,6 +170,7 @@ def update_parameters(
             setattr(params, key, value)
     
     db.commit()
+    invalidate_sector_parameters_cache(params.sector_id)
     
     return {"success": True, "id": params_id, "message": "Parâmetros atualizados"}
 
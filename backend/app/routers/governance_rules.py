@@ -7,12 +7,35 @@ from app.models.governance_rules import GovernanceRules
 from app.schemas.governance_rules import (
     GovernanceRulesCreate,
     GovernanceRulesUpdate,
-    GovernanceRulesResponse
+    GovernanceRulesResponse,
+    GovernanceLaborRulesUpdate,
+    GovernanceOperationalRulesUpdate,
+    GovernanceCleaningTimesUpdate,
+    GovernanceShiftConfigUpdate,
+    GovernanceHolidayRulesUpdate,
+    GovernanceAlternanceRulesUpdate,
 )
 
 router = APIRouter(prefix="/governance-rules", tags=["Regras de Governança"])
 
 
+def _aplicar_atualizacao(db: Session, update_data: dict) -> GovernanceRules:
+    """Aplica os campos informados às regras ativas, criando-as se não existirem."""
+    db_regras = db.query(GovernanceRules).filter(GovernanceRules.is_active == True).first()
+    if not db_regras:
+        db_regras = GovernanceRules()
+        db.add(db_regras)
+        db.commit()
+        db.refresh(db_regras)
+    
+    for key, value in update_data.items():
+        setattr(db_regras, key, value)
+    
+    db.commit()
+    db.refresh(db_regras)
+    return db_regras
+
+
 @router.get("/", response_model=GovernanceRulesResponse)
 def obter_regras_ativas(db: Session = Depends(get_db)):
     """
@@ -60,20 +83,61 @@ def atualizar_regras_ativas(
     db: Session = Depends(get_db)
 ):
     """Atualiza as regras de governança ativas."""
-    db_regras = db.query(GovernanceRules).filter(GovernanceRules.is_active == True).first()
-    if not db_regras:
-        db_regras = GovernanceRules()
-        db.add(db_regras)
-        db.commit()
-        db.refresh(db_regras)
-    
-    update_data = regras.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_regras, key, value)
-    
-    db.commit()
-    db.refresh(db_regras)
-    return db_regras
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
+
+
+@router.put("/trabalhistas", response_model=GovernanceRulesResponse)
+def atualizar_regras_trabalhistas(
+    regras: GovernanceLaborRulesUpdate,
+    db: Session = Depends(get_db)
+):
+    """Atualiza apenas as regras trabalhistas ativas."""
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
+
+
+@router.put("/operacionais", response_model=GovernanceRulesResponse)
+def atualizar_regras_operacionais(
+    regras: GovernanceOperationalRulesUpdate,
+    db: Session = Depends(get_db)
+):
+    """Atualiza apenas as regras operacionais ativas."""
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
+
+
+@router.put("/tempos-limpeza", response_model=GovernanceRulesResponse)
+def atualizar_tempos_limpeza(
+    regras: GovernanceCleaningTimesUpdate,
+    db: Session = Depends(get_db)
+):
+    """Atualiza apenas os tempos de limpeza ativos."""
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
+
+
+@router.put("/turnos", response_model=GovernanceRulesResponse)
+def atualizar_configuracao_turnos(
+    regras: GovernanceShiftConfigUpdate,
+    db: Session = Depends(get_db)
+):
+    """Atualiza apenas as configurações de turno ativas."""
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
+
+
+@router.put("/feriados", response_model=GovernanceRulesResponse)
+def atualizar_regras_feriados(
+    regras: GovernanceHolidayRulesUpdate,
+    db: Session = Depends(get_db)
+):
+    """Atualiza apenas as regras para feriados ativas."""
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
+
+
+@router.put("/alternancia", response_model=GovernanceRulesResponse)
+def atualizar_controle_alternancia(
+    regras: GovernanceAlternanceRulesUpdate,
+    db: Session = Depends(get_db)
+):
+    """Atualiza apenas o controle de alternância ativo."""
+    return _aplicar_atualizacao(db, regras.model_dump(exclude_unset=True))
 
 
 @router.delete("/{id}")
@@ -11,8 +11,10 @@ from app.schemas.regra_calculo_setor import (
     RegraCalculoSetorUpdate,
     RegraCalculoSetorResponse,
     RegraCalculoSetorListResponse,
+    RegraEscopoEnum,
     validar_acao_json
 )
+from app.schemas.base import construct_response
 
 router = APIRouter(prefix="/api/regras-calculo-setor", tags=["Regras de Cálculo por Setor"])
 
@@ -46,7 +48,13 @@ def listar_regras(
     
     regras = query.order_by(RegraCalculoSetor.prioridade.asc()).all()
     
-    return {"regras": regras, "total": len(regras)}
+    return RegraCalculoSetorListResponse.model_construct(
+        regras=[
+            construct_response(RegraCalculoSetorResponse, r, escopo=RegraEscopoEnum(r.escopo))
+            for r in regras
+        ],
+        total=len(regras)
+    )
 
 
 @router.get("/{regra_id}", response_model=RegraCalculoSetorResponse)
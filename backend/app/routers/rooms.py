@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from typing import List, Optional
 from app.database import get_db
 from app.models.room import Room, RoomStatus
@@ -27,11 +28,13 @@ def list_rooms(
 
 @router.get("/status-summary")
 def get_rooms_status_summary(db: Session = Depends(get_db)):
-    rooms = db.query(Room).filter(Room.is_active == True).all()
-    summary = {}
-    for status in RoomStatus:
-        summary[status.value] = sum(1 for r in rooms if r.status == status)
-    return summary
+    counts = dict(
+        db.query(Room.status, func.count(Room.id))
+        .filter(Room.is_active == True)
+        .group_by(Room.status)
+        .all()
+    )
+    return {status.value: counts.get(status, 0) for status in RoomStatus}
 
 
 @router.get("/{room_id}", response_model=RoomResponse)
@@ -98,24 +98,7 @@ def get_operational_rules(
     ).first()
     
     if not rules:
-        rules = SectorOperationalRules(
-            sector_id=sector_id,
-            shift_templates_json={
-                "morning": {"start": "07:00", "end": "15:00"},
-                "afternoon": {"start": "14:00", "end": "22:00"}
-            },
-            productivity_params_json={
-                "tempo_checkout": 25.0,
-                "tempo_estada": 10.0,
-                "jornada_media_horas": 8.0
-            },
-            indicators_json={
-                "fator_feriado": 1.1,
-                "fator_vespera_feriado": 1.05,
-                "fator_pico": 1.2,
-                "fator_baixa_ocupacao": 0.9
-            }
-        )
+        rules = SectorOperationalRules(sector_id=sector_id)
         db.add(rules)
         db.commit()
         db.refresh(rules)
@@ -147,11 +130,11 @@ def update_operational_rules(
         rules.utilization_target_pct = data.utilization_target_pct
         rules.buffer_pct = data.buffer_pct
         if data.shift_templates_json is not None:
-            rules.shift_templates_json = data.shift_templates_json
+            rules.shift_templates_json = data.shift_templates_json.model_dump(exclude_unset=True)
         if data.productivity_params_json is not None:
-            rules.productivity_params_json = data.productivity_params_json
+            rules.productivity_params_json = data.productivity_params_json.model_dump(exclude_unset=True)
         if data.indicators_json is not None:
-            rules.indicators_json = data.indicators_json
+            rules.indicators_json = data.indicators_json.model_dump(exclude_unset=True)
         rules.alternancia_horarios = data.alternancia_horarios
         rules.alternancia_atividades = data.alternancia_atividades
         rules.regime_preferencial = data.regime_preferencial
@@ -11,10 +11,18 @@ from app.schemas.sector_rule import (
     SectorRuleListResponse, ReorderRequest, CloneRequest,
     RuleHierarchyResponse, RuleHierarchyItem
 )
+from app.schemas.base import construct_response
 from app.services.rule_metadata_builder import build_metadata, generate_codigo_from_title
 
 router = APIRouter(prefix="/api/sector-rules", tags=["Sector Rules"])
 
+_HIERARCHY_CATEGORY = {
+    TipoRegra.LABOR: 0,
+    TipoRegra.SYSTEM: 1,
+    TipoRegra.OPERATIONAL: 2,
+    TipoRegra.CALCULATION: 3,
+}
+
 
 def get_tipo_order_expr():
     return case(
@@ -66,7 +74,10 @@ def list_sector_rules(
     )
 
     rules = query.all()
-    return SectorRuleListResponse(items=rules, total=len(rules))
+    return SectorRuleListResponse.model_construct(
+        items=[construct_response(SectorRuleResponse, r) for r in rules],
+        total=len(rules)
+    )
 
 
 @router.get("/global", response_model=List[SectorRuleResponse])
@@ -92,7 +103,7 @@ def list_global_rules(
         query = query.filter(SectorRule.regra_ativa == regra_ativa)
     
     query = query.order_by(get_rigidez_order_expr(), SectorRule.prioridade)
-    return query.all()
+    return [construct_response(SectorRuleResponse, r) for r in query.all()]
 
 
 @router.post("/reorder-global/{tipo_regra}")
@@ -161,15 +172,13 @@ def get_rule_hierarchy(setor_id: int, db: Session = Depends(get_db)):
         SectorRule.regra_ativa == True
     ).order_by(get_tipo_order_expr(), get_rigidez_order_expr(), SectorRule.prioridade).all()
 
-    all_rules = global_rules + sector_rules
-
-    labor_rules = []
-    system_rules = []
-    operational_rules = []
-    calculation_rules = []
+    # Globais antes das setoriais dentro de cada tipo (ordenação estável).
+    all_rules = sorted(global_rules + sector_rules, key=lambda r: _HIERARCHY_CATEGORY.get(r.tipo_regra, 3))
 
+    items = []
+    category_counts = [0, 0, 0, 0]
     for rule in all_rules:
-        item = RuleHierarchyItem(
+        items.append(RuleHierarchyItem(
             codigo_regra=rule.codigo_regra,
             title=rule.title,
             tipo_regra=rule.tipo_regra,
@@ -178,24 +187,20 @@ def get_rule_hierarchy(setor_id: int, db: Session = Depends(get_db)):
             pergunta=rule.pergunta,
             resposta=rule.resposta,
             regra_ativa=rule.regra_ativa
-        )
-        if rule.tipo_regra == TipoRegra.LABOR:
-            labor_rules.append(item)
-        elif rule.tipo_regra == TipoRegra.SYSTEM:
-            system_rules.append(item)
-        elif rule.tipo_regra == TipoRegra.OPERATIONAL:
-            operational_rules.append(item)
-        else:
-            calculation_rules.append(item)
+        ))
+        category_counts[_HIERARCHY_CATEGORY.get(rule.tipo_regra, 3)] += 1
+
+    offsets = []
+    running = 0
+    for count in category_counts:
+        running += count
+        offsets.append(running)
 
     return RuleHierarchyResponse(
         setor_id=setor_id,
         setor_name=sector.name,
-        labor_rules=labor_rules,
-        system_rules=system_rules,
-        operational_rules=operational_rules,
-        calculation_rules=calculation_rules,
-        total_rules=len(all_rules)
+        items=items,
+        category_offsets=tuple(offsets)
     )
 
 
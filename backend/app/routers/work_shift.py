@@ -29,7 +29,7 @@ def create_work_shift(payload: WorkShiftCreate, db: Session = Depends(get_db)):
     for day_data in payload.days:
         day_rule = WorkShiftDayRule(
             work_shift_id=db_shift.id,
-            **day_data.model_dump()
+            **day_data.model_dump(exclude={"id"})
         )
         db.add(day_rule)
     
@@ -61,7 +61,7 @@ def update_work_shift(id: int, payload: WorkShiftUpdate, db: Session = Depends(g
         for day_data in payload.days:
             day_rule = WorkShiftDayRule(
                 work_shift_id=id,
-                **day_data.model_dump()
+                **day_data.model_dump(exclude={"id"})
             )
             db.add(day_rule)
             
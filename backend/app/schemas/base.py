@@ -0,0 +1,69 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Tuple
+from pydantic import AfterValidator, BaseModel, Field, create_model
+
+
+def _intern_all(values: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sys.intern(v) for v in values)
+
+
+# Listas de saída com vocabulário pequeno e fechado (setores, indicadores, padrões):
+# tupla imutável com strings internadas, compartilhadas entre linhas da resposta.
+InternedStrTuple = Annotated[Tuple[str, ...], AfterValidator(_intern_all)]
+
+
+class AuditMixin(BaseModel):
+    """Carimbos de criação/atualização de respostas cujos registros podem não tê-los."""
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TimestampMixin(BaseModel):
+    """Carimbos de criação/atualização de respostas com `created_at` obrigatório."""
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+@lru_cache(maxsize=None)
+def make_partial(
+    model: type[BaseModel],
+    name: str,
+    base: type[BaseModel] = BaseModel,
+    exclude: Tuple[str, ...] = (),
+) -> type[BaseModel]:
+    """
+    Gera o schema de atualização parcial de `model`: todos os campos opcionais
+    com default None, preservando restrições (min/max_length, ge, ...) e descrições.
+
+    `base` permite herdar validadores e métodos específicos da atualização;
+    `exclude` remove campos que não podem ser alterados após a criação.
+    """
+    fields = {}
+    for field_name, info in model.model_fields.items():
+        if field_name in exclude:
+            continue
+        annotation = info.annotation
+        if info.metadata:
+            annotation = Annotated[annotation, *info.metadata]
+        fields[field_name] = (Optional[annotation], Field(None, description=info.description))
+    return create_model(name, __base__=base, __module__=model.__module__, **fields)
+
+
+@lru_cache(maxsize=None)
+def _response_keys(model: type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(model.model_fields)
+
+
+def construct_response(model: type[BaseModel], obj: Any, **overrides: Any) -> BaseModel:
+    """
+    Monta `model` a partir de um objeto ORM sem revalidar os campos.
+
+    Usado em listagens de linhas já persistidas (portanto já validadas), evitando
+    a resolução campo a campo de `from_attributes`. `overrides` cobre campos cujo
+    tipo no banco difere do schema (ex.: enum gravado como string).
+    """
+    data = {key: getattr(obj, key) for key in _response_keys(model)}
+    data.update(overrides)
+    return model.model_construct(**data)
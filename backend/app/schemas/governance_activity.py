@@ -1,8 +1,10 @@
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, field_validator, model_validator, ConfigDict
 from typing import Optional
 from datetime import datetime, date
 from enum import Enum
 
+from app.schemas.base import make_partial
+
 
 class WorkloadDriverEnum(str, Enum):
     VARIABLE = "VARIABLE"
@@ -63,21 +65,7 @@ class GovernanceActivityCreate(GovernanceActivityBase):
         return self
 
 
-class GovernanceActivityUpdate(BaseModel):
-    name: Optional[str] = None
-    code: Optional[str] = None
-    description: Optional[str] = None
-    average_time_minutes: Optional[float] = None
-    unit_type: Optional[str] = None
-    workload_driver: Optional[WorkloadDriverEnum] = None
-    classificacao_atividade: Optional[ActivityClassificationEnum] = None
-    periodicidade_id: Optional[int] = None
-    tolerancia_dias: Optional[int] = None
-    data_primeira_execucao: Optional[date] = None
-    difficulty_level: Optional[int] = None
-    requires_training: Optional[bool] = None
-    is_active: Optional[bool] = None
-    
+class _GovernanceActivityUpdateRules(BaseModel):
     def validate_classification_fields(
         self,
         current_classificacao: str,
@@ -121,11 +109,15 @@ class GovernanceActivityUpdate(BaseModel):
                 raise ValueError('Atividades CALCULADAS_PELO_AGENTE nao podem ter data de primeira execucao.')
 
 
+GovernanceActivityUpdate = make_partial(
+    GovernanceActivityBase, "GovernanceActivityUpdate", base=_GovernanceActivityUpdateRules
+)
+
+
 class GovernanceActivityResponse(GovernanceActivityBase):
     id: int
     sector_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 
+from app.schemas.base import make_partial
+
 
 class PeriodicityType(str, Enum):
     DAILY = "DAILY"
@@ -39,31 +41,28 @@ class PeriodicityCreate(PeriodicityBase):
     intervalo_dias: Optional[int] = Field(None, ge=1, description="Intervalo em dias (retrocompatibilidade, use interval_unit+interval_value)")
     
     def model_post_init(self, __context):
-        if self.intervalo_dias is not None and self.interval_unit == IntervalUnit.DAYS and self.interval_value == 1:
+        if self.intervalo_dias is None:
+            return
+        if self.interval_unit == IntervalUnit.DAYS and self.interval_value == 1:
             object.__setattr__(self, 'interval_value', self.intervalo_dias)
 
 
-class PeriodicityUpdate(BaseModel):
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    tipo: Optional[PeriodicityType] = None
-    interval_unit: Optional[IntervalUnit] = None
-    interval_value: Optional[int] = Field(None, ge=1)
-    anchor_policy: Optional[AnchorPolicy] = None
-    description: Optional[str] = Field(None, max_length=500)
-    is_active: Optional[bool] = None
-    intervalo_dias: Optional[int] = Field(None, ge=1, description="Intervalo em dias (retrocompatibilidade)")
-    
+class _PeriodicityUpdateHooks(BaseModel):
     def model_post_init(self, __context):
-        if self.intervalo_dias is not None and self.interval_unit is None and self.interval_value is None:
+        if self.intervalo_dias is None:
+            return
+        if self.interval_unit is None and self.interval_value is None:
             object.__setattr__(self, 'interval_unit', IntervalUnit.DAYS)
             object.__setattr__(self, 'interval_value', self.intervalo_dias)
 
 
+PeriodicityUpdate = make_partial(PeriodicityCreate, "PeriodicityUpdate", base=_PeriodicityUpdateHooks)
+
+
 class PeriodicityResponse(PeriodicityBase):
     id: int
     intervalo_dias: int = Field(description="Intervalo aproximado em dias (para retrocompatibilidade)")
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 
+from app.schemas.base import make_partial
+
 
 class RegraEscopoEnum(str, Enum):
     DEMANDA = "DEMANDA"
@@ -111,16 +113,8 @@ class RegraCalculoSetorCreate(RegraCalculoSetorBase):
         return self
 
 
-class RegraCalculoSetorUpdate(BaseModel):
-    nome: Optional[str] = Field(None, min_length=1, max_length=200)
-    descricao: Optional[str] = Field(None, max_length=1000)
-    prioridade: Optional[int] = Field(None, ge=1, le=9999)
-    escopo: Optional[RegraEscopoEnum] = None
-    condicao_json: Optional[Dict[str, Any]] = None
-    acao_json: Optional[Dict[str, Any]] = None
-    ativo: Optional[bool] = None
-    
-    @field_validator('condicao_json')
+class _RegraCalculoSetorUpdateValidators(BaseModel):
+    @field_validator('condicao_json', check_fields=False)
     @classmethod
     def validate_condicao(cls, v):
         if v is not None:
@@ -128,14 +122,18 @@ class RegraCalculoSetorUpdate(BaseModel):
         return v
 
 
+RegraCalculoSetorUpdate = make_partial(
+    RegraCalculoSetorBase, "RegraCalculoSetorUpdate", base=_RegraCalculoSetorUpdateValidators
+)
+
+
 class RegraCalculoSetorResponse(RegraCalculoSetorBase):
     id: int
     setor_id: int
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class RegraCalculoSetorListResponse(BaseModel):
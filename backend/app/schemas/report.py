@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Any
 from datetime import date, datetime
 from app.models.report_upload import UploadStatus
+from app.schemas.base import InternedStrTuple, make_partial
 
 
 class ReportTypeBase(BaseModel):
@@ -20,25 +21,20 @@ class ReportTypeCreate(ReportTypeBase):
     pass
 
 
-class ReportTypeUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    file_patterns: Optional[List[str]] = None
-    header_patterns: Optional[List[str]] = None
-    keyword_patterns: Optional[List[str]] = None
-    indicators: Optional[List[str]] = None
-    sectors: Optional[List[str]] = None
-    parser_config: Optional[dict] = None
-    is_active: Optional[bool] = None
+ReportTypeUpdate = make_partial(ReportTypeBase, "ReportTypeUpdate")
 
 
 class ReportTypeResponse(ReportTypeBase):
     id: int
+    file_patterns: InternedStrTuple = ()
+    header_patterns: InternedStrTuple = ()
+    keyword_patterns: InternedStrTuple = ()
+    indicators: InternedStrTuple = ()
+    sectors: InternedStrTuple = ()
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class ReportUploadResponse(BaseModel):
@@ -56,14 +52,13 @@ class ReportUploadResponse(BaseModel):
     status: UploadStatus
     processing_notes: Optional[str] = None
     error_message: Optional[str] = None
-    indicators_found: List[str] = []
-    sectors_affected: List[str] = []
+    indicators_found: InternedStrTuple = ()
+    sectors_affected: InternedStrTuple = ()
     uploaded_by: Optional[str] = None
     processed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class ReportUploadListResponse(BaseModel):
@@ -74,11 +69,10 @@ class ReportUploadListResponse(BaseModel):
     date_start: Optional[date] = None
     date_end: Optional[date] = None
     status: UploadStatus
-    sectors_affected: List[str] = []
+    sectors_affected: InternedStrTuple = ()
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class OccupancyForecastBase(BaseModel):
@@ -101,13 +95,13 @@ class OccupancyForecastCreate(OccupancyForecastBase):
 
 class OccupancyForecastResponse(OccupancyForecastBase):
     id: int
+    events_scheduled: InternedStrTuple = ()
     day_of_week: int
     planning_week_date: Optional[date] = None
     source_report_id: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class OccupancyActualBase(BaseModel):
@@ -137,8 +131,7 @@ class OccupancyActualResponse(OccupancyActualBase):
     source_report_id: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class DeviationHistoryResponse(BaseModel):
@@ -163,8 +156,7 @@ class DeviationHistoryResponse(BaseModel):
     version: int
     last_updated: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class ScheduleAdjustmentRecommendation(BaseModel):
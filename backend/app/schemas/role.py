@@ -1,8 +1,9 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, field_validator, ConfigDict
 from typing import Optional
-from datetime import datetime
 from enum import Enum
 
+from app.schemas.base import TimestampMixin, make_partial
+
 
 class EmploymentTypeEnum(str, Enum):
     INTERMITTENT = "intermitente"
@@ -29,15 +30,8 @@ class RoleCreate(RoleBase):
     pass
 
 
-class RoleUpdate(BaseModel):
-    name: Optional[str] = None
-    cbo_code: Optional[str] = None
-    sector_id: Optional[int] = None
-    employment_type: Optional[EmploymentTypeEnum] = None
-    description: Optional[str] = None
-    is_active: Optional[bool] = None
-    
-    @field_validator('name')
+class _RoleUpdateValidators(BaseModel):
+    @field_validator('name', check_fields=False)
     @classmethod
     def name_not_empty(cls, v: Optional[str]) -> Optional[str]:
         if v is not None and not v.strip():
@@ -45,6 +39,9 @@ class RoleUpdate(BaseModel):
         return v.strip() if v else v
 
 
+RoleUpdate = make_partial(RoleBase, "RoleUpdate", base=_RoleUpdateValidators)
+
+
 class SectorInfo(BaseModel):
     id: int
     name: str
@@ -53,11 +50,8 @@ class SectorInfo(BaseModel):
         from_attributes = True
 
 
-class RoleResponse(RoleBase):
+class RoleResponse(TimestampMixin, RoleBase):
     id: int
     sector: Optional[SectorInfo] = None
-    created_at: datetime
-    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.models.room import RoomStatus, RoomType
+from app.schemas.base import make_partial
 
 
 class RoomBase(BaseModel):
@@ -17,13 +18,7 @@ class RoomCreate(RoomBase):
     pass
 
 
-class RoomUpdate(BaseModel):
-    room_number: Optional[str] = None
-    floor: Optional[int] = None
-    room_type: Optional[RoomType] = None
-    status: Optional[RoomStatus] = None
-    description: Optional[str] = None
-    is_active: Optional[bool] = None
+RoomUpdate = make_partial(RoomBase, "RoomUpdate")
 
 
 class RoomResponse(RoomBase):
@@ -31,5 +26,4 @@ class RoomResponse(RoomBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
@@ -1,9 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
 from enum import Enum
 
 from app.models.sector_rule import TipoRegra, NivelRigidez
+from app.schemas.base import make_partial
 
 
 class RuleCreate(BaseModel):
@@ -20,15 +21,9 @@ class RuleCreate(BaseModel):
     metadados_json: Optional[Dict[str, Any]] = None
 
 
-class RuleUpdate(BaseModel):
-    pergunta: Optional[str] = None
-    resposta: Optional[str] = None
-    nivel_rigidez: Optional[NivelRigidez] = None
-    prioridade: Optional[int] = Field(default=None, ge=1)
-    regra_ativa: Optional[bool] = None
-    validade_inicio: Optional[date] = None
-    validade_fim: Optional[date] = None
-    metadados_json: Optional[Dict[str, Any]] = None
+RuleUpdate = make_partial(
+    RuleCreate, "RuleUpdate", exclude=("setor_id", "tipo_regra", "codigo_regra")
+)
 
 
 class RuleResponse(BaseModel):
@@ -50,8 +45,7 @@ class RuleResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class RuleListResponse(BaseModel):
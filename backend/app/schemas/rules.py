@@ -1,6 +1,41 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
+from app.schemas.base import AuditMixin
+
+
+class ShiftWindow(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+
+class ShiftTemplates(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    morning: Optional[ShiftWindow] = None
+    afternoon: Optional[ShiftWindow] = None
+
+
+class ProductivityParams(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    tempo_checkout: Optional[float] = None
+    tempo_estada: Optional[float] = None
+    jornada_media_horas: Optional[float] = None
+    rooms_per_hour: Optional[float] = None
+    max_daily_hours_override: Optional[float] = None
+    max_week_hours_override: Optional[float] = None
+
+
+class OperationalIndicators(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    fator_feriado: Optional[float] = None
+    fator_vespera_feriado: Optional[float] = None
+    fator_pico: Optional[float] = None
+    fator_baixa_ocupacao: Optional[float] = None
 
 
 class LaborRulesBase(BaseModel):
@@ -25,22 +60,19 @@ class LaborRulesUpdate(LaborRulesBase):
     pass
 
 
-class LaborRulesResponse(LaborRulesBase):
+class LaborRulesResponse(AuditMixin, LaborRulesBase):
     id: int
     is_active: bool
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class SectorOperationalRulesBase(BaseModel):
     utilization_target_pct: float = 85.0
     buffer_pct: float = 10.0
-    shift_templates_json: Optional[Dict[str, Any]] = None
-    productivity_params_json: Optional[Dict[str, Any]] = None
-    indicators_json: Optional[Dict[str, Any]] = None
+    shift_templates_json: Optional[ShiftTemplates] = None
+    productivity_params_json: Optional[ProductivityParams] = None
+    indicators_json: Optional[OperationalIndicators] = None
     alternancia_horarios: bool = True
     alternancia_atividades: bool = True
     regime_preferencial: str = "5x2"
@@ -61,15 +93,12 @@ class SectorOperationalRulesUpdate(SectorOperationalRulesBase):
     pass
 
 
-class SectorOperationalRulesResponse(SectorOperationalRulesBase):
+class SectorOperationalRulesResponse(AuditMixin, SectorOperationalRulesBase):
     id: int
     sector_id: int
     is_active: bool
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class ActivityBase(BaseModel):
@@ -97,16 +126,13 @@ class ActivityUpdate(BaseModel):
     sector_id: Optional[int] = None
 
 
-class ActivityResponse(ActivityBase):
+class ActivityResponse(AuditMixin, ActivityBase):
     id: int
     sector_id: int
     is_active: bool
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
     sector_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class RoleActivityBase(BaseModel):
@@ -125,5 +151,4 @@ class RoleActivityResponse(RoleActivityBase):
     activity_name: Optional[str] = None
     role_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
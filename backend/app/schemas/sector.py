@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
-from datetime import datetime
+from app.schemas.base import TimestampMixin
 
 
 class SectorBase(BaseModel):
@@ -21,10 +21,7 @@ class SectorUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class SectorResponse(SectorBase):
+class SectorResponse(TimestampMixin, SectorBase):
     id: int
-    created_at: datetime
-    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
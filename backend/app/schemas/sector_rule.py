@@ -1,20 +1,12 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Any, Dict
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation, StringConstraints, computed_field
+from typing import Annotated, Optional, List, Any, Dict, Tuple
 from datetime import date, datetime
-from enum import Enum
 
+from app.models.sector_rule import TipoRegra, NivelRigidez
 
-class TipoRegra(str, Enum):
-    LABOR = "LABOR"
-    SYSTEM = "SYSTEM"
-    OPERATIONAL = "OPERATIONAL"
-    CALCULATION = "CALCULATION"
 
-
-class NivelRigidez(str, Enum):
-    MANDATORY = "MANDATORY"
-    DESIRABLE = "DESIRABLE"
-    FLEXIBLE = "FLEXIBLE"
+# Título de regra: mesmo tipo restrito para criação, atualização e clonagem.
+Title200 = Annotated[str, StringConstraints(max_length=200, strip_whitespace=True)]
 
 
 class SectorRuleBase(BaseModel):
@@ -23,7 +15,7 @@ class SectorRuleBase(BaseModel):
     tipo_regra: TipoRegra
     nivel_rigidez: NivelRigidez
     prioridade: int = Field(default=1, ge=1)
-    title: str = Field(..., max_length=200, description="Titulo da regra")
+    title: Title200 = Field(..., description="Titulo da regra")
     pergunta: str
     resposta: str
     regra_ativa: bool = True
@@ -39,7 +31,7 @@ class SectorRuleUpdate(BaseModel):
     tipo_regra: Optional[TipoRegra] = None
     nivel_rigidez: Optional[NivelRigidez] = None
     prioridade: Optional[int] = Field(default=None, ge=1)
-    title: Optional[str] = Field(default=None, max_length=200)
+    title: Optional[Title200] = None
     pergunta: Optional[str] = None
     resposta: Optional[str] = None
     regra_ativa: Optional[bool] = None
@@ -61,13 +53,13 @@ class SectorRuleResponse(BaseModel):
     regra_ativa: bool
     validade_inicio: Optional[date] = None
     validade_fim: Optional[date] = None
-    metadados_json: Optional[Dict[str, Any]] = None
+    # Gerado pelo próprio backend (build_metadata) e lido já decodificado da coluna JSON.
+    metadados_json: SkipValidation[Optional[Dict[str, Any]]] = None
     deleted_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class SectorRuleListResponse(BaseModel):
@@ -80,7 +72,7 @@ class ReorderRequest(BaseModel):
 
 
 class CloneRequest(BaseModel):
-    new_title: str = Field(..., max_length=200, description="Novo titulo para a regra clonada")
+    new_title: Title200 = Field(..., description="Novo titulo para a regra clonada")
 
 
 class RuleHierarchyItem(BaseModel):
@@ -95,10 +87,37 @@ class RuleHierarchyItem(BaseModel):
 
 
 class RuleHierarchyResponse(BaseModel):
+    """
+    Hierarquia de regras de um setor em uma única lista agrupada por tipo
+    (LABOR, SYSTEM, OPERATIONAL, CALCULATION). `category_offsets` guarda o índice
+    final de cada grupo em `items`; as listas por tipo são fatias dessa lista.
+    """
     setor_id: int
     setor_name: str
-    labor_rules: List[RuleHierarchyItem]
-    system_rules: List[RuleHierarchyItem]
-    operational_rules: List[RuleHierarchyItem]
-    calculation_rules: List[RuleHierarchyItem]
-    total_rules: int
+    items: List[RuleHierarchyItem] = Field(exclude=True)
+    category_offsets: Tuple[int, int, int, int] = Field(exclude=True)
+
+    @computed_field
+    @property
+    def labor_rules(self) -> List[RuleHierarchyItem]:
+        return self.items[:self.category_offsets[0]]
+
+    @computed_field
+    @property
+    def system_rules(self) -> List[RuleHierarchyItem]:
+        return self.items[self.category_offsets[0]:self.category_offsets[1]]
+
+    @computed_field
+    @property
+    def operational_rules(self) -> List[RuleHierarchyItem]:
+        return self.items[self.category_offsets[1]:self.category_offsets[2]]
+
+    @computed_field
+    @property
+    def calculation_rules(self) -> List[RuleHierarchyItem]:
+        return self.items[self.category_offsets[2]:self.category_offsets[3]]
+
+    @computed_field
+    @property
+    def total_rules(self) -> int:
+        return len(self.items)
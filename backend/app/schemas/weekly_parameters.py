@@ -1,7 +1,8 @@
-from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime, date
-from app.models.weekly_parameters import DayType
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, List
+from datetime import date
+from app.models.weekly_parameters import DayType, DIAS_SEMANA
+from app.schemas.base import TimestampMixin
 
 
 class DayParameters(BaseModel):
@@ -11,37 +12,20 @@ class DayParameters(BaseModel):
     tipo_dia: DayType = DayType.NORMAL
 
 
+def _default_days() -> List[DayParameters]:
+    # Só valores padrão do próprio schema: monta os 7 dias sem passar pelo validador.
+    return [DayParameters.model_construct() for _ in DIAS_SEMANA]
+
+
 class WeeklyParametersBase(BaseModel):
     sector_id: Optional[int] = None
     semana_inicio: date
-    seg_ocupacao_prevista: float = 0.0
-    seg_quartos_vagos_sujos: int = 0
-    seg_quartos_estada: int = 0
-    seg_tipo_dia: DayType = DayType.NORMAL
-    ter_ocupacao_prevista: float = 0.0
-    ter_quartos_vagos_sujos: int = 0
-    ter_quartos_estada: int = 0
-    ter_tipo_dia: DayType = DayType.NORMAL
-    qua_ocupacao_prevista: float = 0.0
-    qua_quartos_vagos_sujos: int = 0
-    qua_quartos_estada: int = 0
-    qua_tipo_dia: DayType = DayType.NORMAL
-    qui_ocupacao_prevista: float = 0.0
-    qui_quartos_vagos_sujos: int = 0
-    qui_quartos_estada: int = 0
-    qui_tipo_dia: DayType = DayType.NORMAL
-    sex_ocupacao_prevista: float = 0.0
-    sex_quartos_vagos_sujos: int = 0
-    sex_quartos_estada: int = 0
-    sex_tipo_dia: DayType = DayType.NORMAL
-    sab_ocupacao_prevista: float = 0.0
-    sab_quartos_vagos_sujos: int = 0
-    sab_quartos_estada: int = 0
-    sab_tipo_dia: DayType = DayType.NORMAL
-    dom_ocupacao_prevista: float = 0.0
-    dom_quartos_vagos_sujos: int = 0
-    dom_quartos_estada: int = 0
-    dom_tipo_dia: DayType = DayType.NORMAL
+    days: List[DayParameters] = Field(
+        default_factory=_default_days,
+        min_length=7,
+        max_length=7,
+        description="Parâmetros por dia, de segunda (índice 0) a domingo (índice 6)"
+    )
 
 
 class WeeklyParametersCreate(WeeklyParametersBase):
@@ -49,40 +33,15 @@ class WeeklyParametersCreate(WeeklyParametersBase):
 
 
 class WeeklyParametersUpdate(BaseModel):
-    seg_ocupacao_prevista: Optional[float] = None
-    seg_quartos_vagos_sujos: Optional[int] = None
-    seg_quartos_estada: Optional[int] = None
-    seg_tipo_dia: Optional[DayType] = None
-    ter_ocupacao_prevista: Optional[float] = None
-    ter_quartos_vagos_sujos: Optional[int] = None
-    ter_quartos_estada: Optional[int] = None
-    ter_tipo_dia: Optional[DayType] = None
-    qua_ocupacao_prevista: Optional[float] = None
-    qua_quartos_vagos_sujos: Optional[int] = None
-    qua_quartos_estada: Optional[int] = None
-    qua_tipo_dia: Optional[DayType] = None
-    qui_ocupacao_prevista: Optional[float] = None
-    qui_quartos_vagos_sujos: Optional[int] = None
-    qui_quartos_estada: Optional[int] = None
-    qui_tipo_dia: Optional[DayType] = None
-    sex_ocupacao_prevista: Optional[float] = None
-    sex_quartos_vagos_sujos: Optional[int] = None
-    sex_quartos_estada: Optional[int] = None
-    sex_tipo_dia: Optional[DayType] = None
-    sab_ocupacao_prevista: Optional[float] = None
-    sab_quartos_vagos_sujos: Optional[int] = None
-    sab_quartos_estada: Optional[int] = None
-    sab_tipo_dia: Optional[DayType] = None
-    dom_ocupacao_prevista: Optional[float] = None
-    dom_quartos_vagos_sujos: Optional[int] = None
-    dom_quartos_estada: Optional[int] = None
-    dom_tipo_dia: Optional[DayType] = None
+    days: Optional[List[Optional[DayParameters]]] = Field(
+        None,
+        min_length=7,
+        max_length=7,
+        description="Dias a atualizar (segunda a domingo); null mantém o dia inalterado"
+    )
 
 
-class WeeklyParametersResponse(WeeklyParametersBase):
+class WeeklyParametersResponse(TimestampMixin, WeeklyParametersBase):
     id: int
-    created_at: datetime
-    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
-from datetime import datetime, date
+from datetime import date
 from app.models.weekly_schedule import ScheduleStatus
+from app.schemas.base import TimestampMixin
 
 
 class WeeklyScheduleBase(BaseModel):
@@ -18,13 +19,10 @@ class WeeklyScheduleCreate(WeeklyScheduleBase):
     pass
 
 
-class WeeklyScheduleResponse(WeeklyScheduleBase):
+class WeeklyScheduleResponse(TimestampMixin, WeeklyScheduleBase):
     id: int
-    created_at: datetime
-    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class ScheduleGenerationRequest(BaseModel):
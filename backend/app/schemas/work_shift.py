@@ -1,14 +1,29 @@
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional, List
 from datetime import time
-from enum import Enum
-
-class ShiftTimeConstraint(str, Enum):
-    MANDATORY = "MANDATORY"
-    FLEXIBLE = "FLEXIBLE"
+from app.models.work_shift import ShiftTimeConstraint
+
+def _coherence_error(
+    start: Optional[time],
+    break_out: Optional[time],
+    break_in: Optional[time],
+    end: Optional[time],
+) -> Optional[str]:
+    """Retorna a mensagem da primeira regra de horário violada, ou None se o dia é coerente."""
+    if (start is None) != (end is None):
+        return 'Both start_time and end_time must be defined if one is present'
+    if start is not None and end <= start:
+        return 'end_time must be after start_time'
+    if (break_out is None) != (break_in is None):
+        return 'Both break_out_time and break_in_time must be defined or both null'
+    if break_out is not None and (start is None or not (start < break_out < break_in < end)):
+        return 'Invalid interval sequence: start < break_out < break_in < end'
+    return None
 
 class WorkShiftDayRuleBase(BaseModel):
-    weekday: int
+    # Um único schema para entrada e saída: `id` só vem preenchido nas respostas.
+    id: Optional[int] = None
+    weekday: int = Field(..., ge=1, le=7, description="Dia da semana ISO (1=segunda, 7=domingo)")
     start_time: Optional[time] = None
     break_out_time: Optional[time] = None
     break_in_time: Optional[time] = None
@@ -16,50 +31,26 @@ class WorkShiftDayRuleBase(BaseModel):
     start_constraint: ShiftTimeConstraint = ShiftTimeConstraint.FLEXIBLE
     end_constraint: ShiftTimeConstraint = ShiftTimeConstraint.FLEXIBLE
 
-    @field_validator('weekday')
-    @classmethod
-    def validate_weekday(cls, v):
-        if not (1 <= v <= 7):
-            raise ValueError('Weekday must be between 1 and 7 (ISO)')
-        return v
-
     @model_validator(mode='after')
     def validate_coherence(self) -> 'WorkShiftDayRuleBase':
-        if self.start_time is not None or self.end_time is not None:
-            if self.start_time is None or self.end_time is None:
-                raise ValueError('Both start_time and end_time must be defined if one is present')
-            
-            if self.end_time <= self.start_time:
-                raise ValueError('end_time must be after start_time')
-
-        has_break_out = self.break_out_time is not None
-        has_break_in = self.break_in_time is not None
-        if has_break_out != has_break_in:
-            raise ValueError('Both break_out_time and break_in_time must be defined or both null')
-
-        if has_break_out:
-            if not (self.start_time < self.break_out_time < self.break_in_time < self.end_time):
-                raise ValueError('Invalid interval sequence: start < break_out < break_in < end')
-
+        error = _coherence_error(self.start_time, self.break_out_time, self.break_in_time, self.end_time)
+        if error is not None:
+            raise ValueError(error)
         return self
 
-class WorkShiftDayRuleCreate(WorkShiftDayRuleBase):
-    pass
+    model_config = ConfigDict(from_attributes=True)
 
-class WorkShiftDayRuleResponse(WorkShiftDayRuleBase):
-    id: int
-    class Config:
-        from_attributes = True
+WorkShiftDayRuleResponse = WorkShiftDayRuleBase
 
 class WorkShiftCreate(BaseModel):
     sector_id: int
     name: str
-    days: List[WorkShiftDayRuleCreate]
+    days: List[WorkShiftDayRuleBase]
 
 class WorkShiftUpdate(BaseModel):
     name: Optional[str] = None
     is_active: Optional[bool] = None
-    days: Optional[List[WorkShiftDayRuleCreate]] = None
+    days: Optional[List[WorkShiftDayRuleBase]] = None
 
 class WorkShiftResponse(BaseModel):
     id: int
@@ -68,5 +59,4 @@ class WorkShiftResponse(BaseModel):
     is_active: bool
     day_rules: List[WorkShiftDayRuleResponse]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
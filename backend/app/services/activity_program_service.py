@@ -1,7 +1,8 @@
+from collections import defaultdict
 from datetime import date, time, timedelta
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import and_, exists, insert, literal, select, update
 
 from app.models.activity_program import (
     ActivityProgramWeek, ActivityProgramItem, 
@@ -13,9 +14,19 @@ from app.models.governance_module import ForecastRun, ForecastRunType, ForecastR
 from app.models.data_lake import OccupancyLatest
 from app.models.audit_log import AuditLog, AuditAction
 from app.models.governance_activity import ActivityClassification
+from app.models.regra_calculo_setor import RegraEscopo
 from app.services import regra_calculo_service
 
 
+# Sigla do dia indexada por date.weekday() (0 = segunda).
+DIAS_SEMANA = ("SEG", "TER", "QUA", "QUI", "SEX", "SAB", "DOM")
+
+# Janelas de execução (início, fim) dos itens gerados automaticamente.
+JANELA_PADRAO = (time(8, 0), time(17, 0))
+JANELA_SAIDAS = (time(10, 0), time(15, 0))
+JANELA_ESTADIAS = (time(9, 0), time(14, 0))
+
+
 class ActivityProgramService:
     
     @staticmethod
@@ -32,14 +43,15 @@ class ActivityProgramService:
         mode: str = "MANUAL",
         created_by: str = "system"
     ) -> ActivityProgramWeek:
-        existing = db.query(ActivityProgramWeek).filter(
+        # Só o id, servido pelo índice único uq_sector_run_week; a linha completa apenas se existir.
+        existing_id = db.query(ActivityProgramWeek.id).filter(
             ActivityProgramWeek.sector_id == sector_id,
             ActivityProgramWeek.forecast_run_id == forecast_run_id,
             ActivityProgramWeek.week_start == week_start
-        ).first()
+        ).scalar()
         
-        if existing:
-            return existing
+        if existing_id is not None:
+            return db.get(ActivityProgramWeek, existing_id)
         
         program_week = ActivityProgramWeek(
             sector_id=sector_id,
@@ -60,15 +72,64 @@ class ActivityProgramService:
             
             ActivityProgramService._generate_auto_items_com_regras(db, program_week, created_by)
         
+        ActivityProgramService._audit(
+            db, AuditAction.PROGRAM_WEEK_CREATED, program_week, created_by,
+            f"Programação semanal criada (modo {mode})",
+            {"mode": mode, "sector_id": sector_id, "week_start": str(week_start)}
+        )
         db.commit()
         db.refresh(program_week)
         
-        AuditLog.log(db, "activity_program_weeks", program_week.id, 
-                     AuditAction.CREATE, created_by, 
-                     {"mode": mode, "sector_id": sector_id})
-        
         return program_week
     
+    @staticmethod
+    def _audit(
+        db: Session,
+        action: AuditAction,
+        program_week: ActivityProgramWeek,
+        actor: str,
+        description: str,
+        new_values: Dict[str, Any]
+    ):
+        """Registra a auditoria na mesma transação da alteração: gravada no mesmo commit."""
+        db.add(AuditLog(
+            action=action,
+            entity_type="ActivityProgramWeek",
+            entity_id=program_week.id,
+            user_name=actor,
+            description=description,
+            new_values=new_values
+        ))
+    
+    @staticmethod
+    def _week_occupancy(
+        db: Session,
+        week_start: date,
+        forecast_data: Dict[date, Dict[str, Any]]
+    ) -> Dict[date, float]:
+        """
+        Ocupação (%) de cada dia da semana: occ_adj da previsão quando houver,
+        senão OccupancyLatest (uma única consulta para os dias faltantes), senão 70%.
+        """
+        occ_by_day = {}
+        missing = []
+        for day_offset in range(7):
+            op_date = week_start + timedelta(days=day_offset)
+            occ_adj = forecast_data.get(op_date, {}).get("occ_adj")
+            if occ_adj is not None:
+                occ_by_day[op_date] = occ_adj
+            else:
+                missing.append(op_date)
+        
+        if missing:
+            latest = dict(db.query(OccupancyLatest.target_date, OccupancyLatest.occupancy_pct).filter(
+                OccupancyLatest.target_date.in_(missing)
+            ).all())
+            for op_date in missing:
+                occ_by_day[op_date] = latest[op_date] if op_date in latest else 70.0
+        
+        return occ_by_day
+    
     @staticmethod
     def _generate_auto_items(
         db: Session,
@@ -86,21 +147,26 @@ class ActivityProgramService:
         
         week_start, week_end = ActivityProgramService.get_week_bounds(program_week.week_start)
         
-        forecast_run = db.query(ForecastRun).filter(
-            ForecastRun.id == program_week.forecast_run_id
-        ).first()
+        forecast_run_exists = db.query(
+            exists().where(ForecastRun.id == program_week.forecast_run_id)
+        ).scalar()
         
         from app.models.governance_module import ForecastDaily, SectorOperationalParameters
         forecast_data = {}
-        if forecast_run:
-            daily_forecasts = db.query(ForecastDaily).filter(
-                ForecastDaily.forecast_run_id == forecast_run.id
+        if forecast_run_exists:
+            daily_forecasts = db.query(
+                ForecastDaily.target_date,
+                ForecastDaily.occ_adj,
+                ForecastDaily.occ_raw,
+                ForecastDaily.bias_pp_used
+            ).filter(
+                ForecastDaily.forecast_run_id == program_week.forecast_run_id
             ).all()
             for df in daily_forecasts:
                 forecast_data[df.target_date] = {
                     "occ_adj": df.occ_adj,
                     "occ_raw": df.occ_raw,
-                    "bias_pp": df.bias_pp
+                    "bias_pp": df.bias_pp_used
                 }
         
         sector_params = db.query(SectorOperationalParameters).filter(
@@ -110,25 +176,37 @@ class ActivityProgramService:
         
         is_governance = sector and sector.name.lower() in ["governança", "governanca", "housekeeping"]
         
+        if is_governance:
+            # Atividades de saída e de estadia resolvidas uma vez para os 7 dias.
+            lowered = [(a, a.name.lower()) for a in activities]
+            checkout_activity = next(
+                (a for a, name in lowered if "vago" in name or "checkout" in name or "saída" in name),
+                activities[0]
+            )
+            stayover_activity = next(
+                (a for a, name in lowered if "estadia" in name or "ocupado" in name),
+                activities[1] if len(activities) > 1 else activities[0]
+            )
+        
+        occ_by_day = ActivityProgramService._week_occupancy(db, week_start, forecast_data)
+        
+        rows = []
         for day_offset in range(7):
             op_date = week_start + timedelta(days=day_offset)
             
-            if op_date in forecast_data and forecast_data[op_date].get("occ_adj") is not None:
-                occ_pct = forecast_data[op_date]["occ_adj"]
-            else:
-                occupancy = db.query(OccupancyLatest).filter(
-                    OccupancyLatest.target_date == op_date
-                ).first()
-                occ_pct = occupancy.occupancy_pct if occupancy else 70.0
+            occ_pct = occ_by_day[op_date]
             
             if is_governance:
-                ActivityProgramService._generate_governance_items(
-                    db, program_week, op_date, activities, occ_pct, created_by, total_rooms
-                )
+                rows.extend(ActivityProgramService._generate_governance_items(
+                    program_week, op_date, checkout_activity, stayover_activity,
+                    occ_pct, created_by, total_rooms
+                ))
             else:
-                ActivityProgramService._generate_generic_items(
-                    db, program_week, op_date, activities, occ_pct, created_by
-                )
+                rows.extend(ActivityProgramService._generate_generic_items(
+                    program_week, op_date, activities, occ_pct, created_by
+                ))
+        
+        db.bulk_insert_mappings(ActivityProgramItem, rows)
     
     @staticmethod
     def _generate_auto_items_com_regras(
@@ -139,24 +217,38 @@ class ActivityProgramService:
         """Gera itens usando regras de cálculo definidas para o setor."""
         from app.models.governance_module import ForecastDaily, SectorOperationalParameters
         
-        sector = db.query(Sector).filter(Sector.id == program_week.sector_id).first()
+        # As regras só devolvem atividades ativas; carregadas uma vez para toda a semana.
+        activities_by_id = {
+            a.id: a for a in db.query(GovernanceActivity).filter(
+                GovernanceActivity.sector_id == program_week.sector_id,
+                GovernanceActivity.is_active == True
+            ).all()
+        }
+        
+        if not activities_by_id:
+            return
         
         week_start, week_end = ActivityProgramService.get_week_bounds(program_week.week_start)
         
-        forecast_run = db.query(ForecastRun).filter(
-            ForecastRun.id == program_week.forecast_run_id
-        ).first()
+        forecast_run_exists = db.query(
+            exists().where(ForecastRun.id == program_week.forecast_run_id)
+        ).scalar()
         
         forecast_data = {}
-        if forecast_run:
-            daily_forecasts = db.query(ForecastDaily).filter(
-                ForecastDaily.forecast_run_id == forecast_run.id
+        if forecast_run_exists:
+            daily_forecasts = db.query(
+                ForecastDaily.target_date,
+                ForecastDaily.occ_adj,
+                ForecastDaily.occ_raw,
+                ForecastDaily.bias_pp_used
+            ).filter(
+                ForecastDaily.forecast_run_id == program_week.forecast_run_id
             ).all()
             for df in daily_forecasts:
                 forecast_data[df.target_date] = {
                     "occ_adj": df.occ_adj,
                     "occ_raw": df.occ_raw,
-                    "bias_pp": df.bias_pp
+                    "bias_pp": df.bias_pp_used
                 }
         
         sector_params = db.query(SectorOperationalParameters).filter(
@@ -165,19 +257,19 @@ class ActivityProgramService:
         total_rooms = sector_params.total_rooms if sector_params else 100
         checkout_rate = 0.25
         
-        dias_semana_map = {0: "SEG", 1: "TER", 2: "QUA", 3: "QUI", 4: "SEX", 5: "SAB", 6: "DOM"}
+        occ_by_day = ActivityProgramService._week_occupancy(db, week_start, forecast_data)
+        
+        # Regras de programação carregadas uma vez; só o contexto muda de um dia para outro.
+        regras_programacao = regra_calculo_service.obter_regras_setor(
+            db, program_week.sector_id, RegraEscopo.PROGRAMACAO
+        )
         
+        rows = []
         for day_offset in range(7):
             op_date = week_start + timedelta(days=day_offset)
-            dia_semana = dias_semana_map.get(op_date.weekday(), "SEG")
+            dia_semana = DIAS_SEMANA[op_date.weekday()]
             
-            if op_date in forecast_data and forecast_data[op_date].get("occ_adj") is not None:
-                occ_pct = forecast_data[op_date]["occ_adj"]
-            else:
-                occupancy = db.query(OccupancyLatest).filter(
-                    OccupancyLatest.target_date == op_date
-                ).first()
-                occ_pct = occupancy.occupancy_pct if occupancy else 70.0
+            occ_pct = occ_by_day[op_date]
             
             quartos_ocupados = int(total_rooms * (occ_pct / 100))
             checkouts = int(quartos_ocupados * checkout_rate)
@@ -194,21 +286,32 @@ class ActivityProgramService:
             }
             
             atividades_programadas = regra_calculo_service.obter_atividades_programacao(
-                db, program_week.sector_id, contexto
+                db, program_week.sector_id, contexto,
+                regras=regras_programacao, atividades_ativas=activities_by_id
             )
             
+            # Parte de drivers_json comum a todos os itens do dia.
+            day_drivers = {
+                "ocupacao": occ_pct,
+                "dia_semana": dia_semana,
+                "quartos_ocupados": quartos_ocupados
+            }
+            
             for ativ_info in atividades_programadas:
-                atividade = db.query(GovernanceActivity).filter(
-                    GovernanceActivity.id == ativ_info["atividade_id"]
-                ).first()
+                atividade = activities_by_id.get(ativ_info["atividade_id"])
+                if atividade is None:
+                    # Regra apontando para atividade de outro setor: busca pelo mapa de identidade da sessão.
+                    atividade = db.get(GovernanceActivity, ativ_info["atividade_id"])
+                    activities_by_id[ativ_info["atividade_id"]] = atividade
                 
                 if not atividade:
                     continue
                 
                 if atividade.workload_driver and atividade.workload_driver.value == "VARIABLE":
-                    if "vago" in atividade.name.lower() or "checkout" in atividade.name.lower():
+                    name_lower = atividade.name.lower()
+                    if "vago" in name_lower or "checkout" in name_lower:
                         quantity = max(1, checkouts)
-                    elif "estadia" in atividade.name.lower() or "stayover" in atividade.name.lower():
+                    elif "estadia" in name_lower or "stayover" in name_lower:
                         quantity = max(1, stayovers)
                     else:
                         quantity = max(1, quartos_ocupados)
@@ -217,39 +320,40 @@ class ActivityProgramService:
                 
                 workload = int(quantity * atividade.average_time_minutes)
                 
-                item = ActivityProgramItem(
+                rows.append(dict(
                     program_week_id=program_week.id,
                     sector_id=program_week.sector_id,
                     activity_id=atividade.id,
                     op_date=op_date,
-                    window_start=time(8, 0),
-                    window_end=time(17, 0),
+                    window_start=JANELA_PADRAO[0],
+                    window_end=JANELA_PADRAO[1],
                     quantity=quantity,
                     workload_minutes=workload,
                     priority=1,
                     source=ProgramItemSource.AUTO,
                     drivers_json={
-                        "ocupacao": occ_pct,
-                        "dia_semana": dia_semana,
-                        "quartos_ocupados": quartos_ocupados,
+                        **day_drivers,
                         "regra_id": ativ_info.get("regra_id"),
                         "regra_nome": ativ_info.get("regra_nome"),
                         "calculation": f"{quantity} unidades x {atividade.average_time_minutes} min"
                     },
                     created_by=created_by
-                )
-                db.add(item)
+                ))
+        
+        # Um único INSERT multi-linha para a semana inteira.
+        db.bulk_insert_mappings(ActivityProgramItem, rows)
     
     @staticmethod
     def _generate_governance_items(
-        db: Session,
         program_week: ActivityProgramWeek,
         op_date: date,
-        activities: List[GovernanceActivity],
+        checkout_activity: Optional[GovernanceActivity],
+        stayover_activity: Optional[GovernanceActivity],
         occ_pct: float,
         created_by: str,
         total_rooms: int = 100
-    ):
+    ) -> List[Dict[str, Any]]:
+        """Linhas de ActivityProgramItem do dia (saídas e estadias) para inserção em lote."""
         checkout_rate = 0.25
         stayover_rate = occ_pct / 100 * (1 - checkout_rate)
         departure_rate = occ_pct / 100 * checkout_rate
@@ -258,25 +362,16 @@ class ActivityProgramService:
         departures = int(room_count * departure_rate)
         stayovers = int(room_count * stayover_rate)
         
-        checkout_activity = next(
-            (a for a in activities if "vago" in a.name.lower() or "checkout" in a.name.lower() or "saída" in a.name.lower()),
-            activities[0] if activities else None
-        )
-        
-        stayover_activity = next(
-            (a for a in activities if "estadia" in a.name.lower() or "ocupado" in a.name.lower()),
-            activities[1] if len(activities) > 1 else (activities[0] if activities else None)
-        )
-        
+        rows = []
         if checkout_activity:
             workload = int(departures * checkout_activity.average_time_minutes)
-            item = ActivityProgramItem(
+            rows.append(dict(
                 program_week_id=program_week.id,
                 sector_id=program_week.sector_id,
                 activity_id=checkout_activity.id,
                 op_date=op_date,
-                window_start=time(10, 0),
-                window_end=time(15, 0),
+                window_start=JANELA_SAIDAS[0],
+                window_end=JANELA_SAIDAS[1],
                 quantity=max(1, departures),
                 workload_minutes=workload,
                 priority=1,
@@ -289,18 +384,17 @@ class ActivityProgramService:
                     "calculation": f"{departures} quartos x {checkout_activity.average_time_minutes} min"
                 },
                 created_by=created_by
-            )
-            db.add(item)
+            ))
         
         if stayover_activity and stayover_activity != checkout_activity:
             workload = int(stayovers * stayover_activity.average_time_minutes)
-            item = ActivityProgramItem(
+            rows.append(dict(
                 program_week_id=program_week.id,
                 sector_id=program_week.sector_id,
                 activity_id=stayover_activity.id,
                 op_date=op_date,
-                window_start=time(9, 0),
-                window_end=time(14, 0),
+                window_start=JANELA_ESTADIAS[0],
+                window_end=JANELA_ESTADIAS[1],
                 quantity=max(1, stayovers),
                 workload_minutes=workload,
                 priority=2,
@@ -313,29 +407,31 @@ class ActivityProgramService:
                     "calculation": f"{stayovers} quartos x {stayover_activity.average_time_minutes} min"
                 },
                 created_by=created_by
-            )
-            db.add(item)
+            ))
+        
+        return rows
     
     @staticmethod
     def _generate_generic_items(
-        db: Session,
         program_week: ActivityProgramWeek,
         op_date: date,
         activities: List[GovernanceActivity],
         occ_pct: float,
         created_by: str
-    ):
+    ) -> List[Dict[str, Any]]:
+        """Linhas de ActivityProgramItem do dia para setores sem regra específica."""
+        rows = []
         for activity in activities[:3]:
             quantity = max(1, int(occ_pct / 20))
             workload = int(quantity * activity.average_time_minutes)
             
-            item = ActivityProgramItem(
+            rows.append(dict(
                 program_week_id=program_week.id,
                 sector_id=program_week.sector_id,
                 activity_id=activity.id,
                 op_date=op_date,
-                window_start=time(8, 0),
-                window_end=time(17, 0),
+                window_start=JANELA_PADRAO[0],
+                window_end=JANELA_PADRAO[1],
                 quantity=quantity,
                 workload_minutes=workload,
                 priority=3,
@@ -346,8 +442,9 @@ class ActivityProgramService:
                     "avg_time_min": activity.average_time_minutes
                 },
                 created_by=created_by
-            )
-            db.add(item)
+            ))
+        
+        return rows
     
     @staticmethod
     def add_item(
@@ -363,7 +460,12 @@ class ActivityProgramService:
         notes: Optional[str] = None,
         created_by: str = "user"
     ) -> ActivityProgramItem:
-        program_week = db.query(ActivityProgramWeek).filter(
+        # Só as colunas usadas nas validações; nenhum objeto ORM é montado.
+        program_week = db.query(
+            ActivityProgramWeek.status,
+            ActivityProgramWeek.week_start,
+            ActivityProgramWeek.sector_id
+        ).filter(
             ActivityProgramWeek.id == program_week_id
         ).first()
         
@@ -373,7 +475,10 @@ class ActivityProgramService:
         if program_week.status == ProgramWeekStatus.LOCKED:
             raise ValueError("Cannot modify locked program")
         
-        activity = db.query(GovernanceActivity).filter(
+        activity = db.query(
+            GovernanceActivity.sector_id,
+            GovernanceActivity.average_time_minutes
+        ).filter(
             GovernanceActivity.id == activity_id
         ).first()
         
@@ -419,6 +524,24 @@ class ActivityProgramService:
         
         return item
     
+    @staticmethod
+    def _item_with_week_status(db: Session, item_id: int):
+        """Item e status da sua semana numa só consulta; None se o item não existe."""
+        return db.query(ActivityProgramItem, ActivityProgramWeek.status).join(
+            ActivityProgramWeek, ActivityProgramItem.program_week_id == ActivityProgramWeek.id
+        ).filter(
+            ActivityProgramItem.id == item_id
+        ).first()
+    
+    @staticmethod
+    def _check_item_modifiable(db: Session, item_id: int) -> None:
+        """Levanta o erro de item inexistente ou de semana travada."""
+        row = ActivityProgramService._item_with_week_status(db, item_id)
+        if row is None:
+            raise ValueError("Item not found")
+        if row[1] == ProgramWeekStatus.LOCKED:
+            raise ValueError("Cannot modify locked program")
+    
     @staticmethod
     def update_item(
         db: Session,
@@ -426,51 +549,54 @@ class ActivityProgramService:
         updates: Dict[str, Any],
         updated_by: str = "user"
     ) -> ActivityProgramItem:
-        item = db.query(ActivityProgramItem).filter(
-            ActivityProgramItem.id == item_id
-        ).first()
-        
-        if not item:
-            raise ValueError("Item not found")
-        
-        program_week = db.query(ActivityProgramWeek).filter(
-            ActivityProgramWeek.id == item.program_week_id
-        ).first()
-        
-        if program_week and program_week.status == ProgramWeekStatus.LOCKED:
-            raise ValueError("Cannot modify locked program")
-        
         allowed_fields = ["quantity", "workload_minutes", "priority", 
                           "window_start", "window_end", "notes", "op_date"]
         
+        values = {}
         for field, value in updates.items():
             if field in allowed_fields:
+                error = None
                 if field == "quantity" and value < 1:
-                    raise ValueError("Quantity must be at least 1")
-                if field == "workload_minutes" and value is not None and value < 0:
-                    raise ValueError("Workload cannot be negative")
-                setattr(item, field, value)
+                    error = "Quantity must be at least 1"
+                elif field == "workload_minutes" and value is not None and value < 0:
+                    error = "Workload cannot be negative"
+                if error:
+                    # Item inexistente ou semana travada têm precedência sobre valor inválido
+                    ActivityProgramService._check_item_modifiable(db, item_id)
+                    raise ValueError(error)
+                values[field] = value
+        
+        # Checagem de bloqueio e escrita num único UPDATE; sem carregar o item antes.
+        item = db.execute(
+            update(ActivityProgramItem)
+            .where(
+                ActivityProgramItem.id == item_id,
+                ~exists().where(
+                    ActivityProgramWeek.id == ActivityProgramItem.program_week_id,
+                    ActivityProgramWeek.status == ProgramWeekStatus.LOCKED
+                )
+            )
+            .values(**values, updated_by=updated_by)
+            .returning(ActivityProgramItem)
+        ).scalar_one_or_none()
+        
+        if item is None:
+            ActivityProgramService._check_item_modifiable(db, item_id)
+            raise ValueError("Cannot modify locked program")
         
-        item.updated_by = updated_by
         db.commit()
-        db.refresh(item)
         
         return item
     
     @staticmethod
     def delete_item(db: Session, item_id: int, deleted_by: str = "user") -> bool:
-        item = db.query(ActivityProgramItem).filter(
-            ActivityProgramItem.id == item_id
-        ).first()
+        row = ActivityProgramService._item_with_week_status(db, item_id)
         
-        if not item:
+        if not row:
             return False
         
-        program_week = db.query(ActivityProgramWeek).filter(
-            ActivityProgramWeek.id == item.program_week_id
-        ).first()
-        
-        if program_week and program_week.status == ProgramWeekStatus.LOCKED:
+        item, week_status = row
+        if week_status == ProgramWeekStatus.LOCKED:
             raise ValueError("Cannot modify locked program")
         
         db.delete(item)
@@ -478,38 +604,60 @@ class ActivityProgramService:
         
         return True
     
+    @staticmethod
+    def _transition_status(
+        db: Session,
+        program_week_id: int,
+        from_status: ProgramWeekStatus,
+        to_status: ProgramWeekStatus,
+        actor: str,
+        action: AuditAction
+    ) -> ActivityProgramWeek:
+        """
+        Muda o status da semana num único UPDATE condicional (checagem e escrita atômicas).
+        Se nenhuma linha mudar, relê o status apenas para montar a mensagem de erro.
+        """
+        program_week = db.execute(
+            update(ActivityProgramWeek)
+            .where(
+                ActivityProgramWeek.id == program_week_id,
+                ActivityProgramWeek.status == from_status
+            )
+            .values(status=to_status, updated_by=actor)
+            .returning(ActivityProgramWeek)
+        ).scalar_one_or_none()
+        
+        if program_week is None:
+            current = db.query(ActivityProgramWeek.status).filter(
+                ActivityProgramWeek.id == program_week_id
+            ).scalar()
+            if current is None:
+                raise ValueError("Program week not found")
+            if current == ProgramWeekStatus.LOCKED:
+                raise ValueError("Program is already locked")
+            if current == to_status:
+                raise ValueError(f"Program is already {to_status.value}")
+            raise ValueError(f"Only {from_status.name} programs can be {to_status.value}")
+        
+        ActivityProgramService._audit(
+            db, action, program_week, actor,
+            f"Programação semanal: {from_status.name} -> {to_status.name}",
+            {"old_status": from_status.name, "new_status": to_status.name}
+        )
+        db.commit()
+        
+        return program_week
+    
     @staticmethod
     def approve_program(
         db: Session, 
         program_week_id: int, 
         approved_by: str = "user"
     ) -> ActivityProgramWeek:
-        program_week = db.query(ActivityProgramWeek).filter(
-            ActivityProgramWeek.id == program_week_id
-        ).first()
-        
-        if not program_week:
-            raise ValueError("Program week not found")
-        
-        if program_week.status == ProgramWeekStatus.LOCKED:
-            raise ValueError("Program is already locked")
-        
-        if program_week.status == ProgramWeekStatus.APPROVED:
-            raise ValueError("Program is already approved")
-        
-        if program_week.status != ProgramWeekStatus.DRAFT:
-            raise ValueError("Only DRAFT programs can be approved")
-        
-        program_week.status = ProgramWeekStatus.APPROVED
-        program_week.updated_by = approved_by
-        db.commit()
-        db.refresh(program_week)
-        
-        AuditLog.log(db, "activity_program_weeks", program_week.id,
-                     AuditAction.UPDATE, approved_by,
-                     {"action": "approve", "new_status": "APPROVED"})
-        
-        return program_week
+        return ActivityProgramService._transition_status(
+            db, program_week_id, ProgramWeekStatus.DRAFT, ProgramWeekStatus.APPROVED,
+            approved_by, AuditAction.PROGRAM_WEEK_APPROVED
+        )
     
     @staticmethod
     def lock_program(
@@ -517,29 +665,10 @@ class ActivityProgramService:
         program_week_id: int, 
         locked_by: str = "admin"
     ) -> ActivityProgramWeek:
-        program_week = db.query(ActivityProgramWeek).filter(
-            ActivityProgramWeek.id == program_week_id
-        ).first()
-        
-        if not program_week:
-            raise ValueError("Program week not found")
-        
-        if program_week.status == ProgramWeekStatus.LOCKED:
-            raise ValueError("Program is already locked")
-        
-        if program_week.status != ProgramWeekStatus.APPROVED:
-            raise ValueError("Only APPROVED programs can be locked")
-        
-        program_week.status = ProgramWeekStatus.LOCKED
-        program_week.updated_by = locked_by
-        db.commit()
-        db.refresh(program_week)
-        
-        AuditLog.log(db, "activity_program_weeks", program_week.id,
-                     AuditAction.UPDATE, locked_by,
-                     {"action": "lock", "new_status": "LOCKED"})
-        
-        return program_week
+        return ActivityProgramService._transition_status(
+            db, program_week_id, ProgramWeekStatus.APPROVED, ProgramWeekStatus.LOCKED,
+            locked_by, AuditAction.PROGRAM_WEEK_LOCKED
+        )
     
     @staticmethod
     def create_adjustment(
@@ -586,23 +715,21 @@ class ActivityProgramService:
             db.add(new_program)
             db.flush()
             
-            for item in original_program.items:
-                new_item = ActivityProgramItem(
-                    program_week_id=new_program.id,
-                    sector_id=item.sector_id,
-                    activity_id=item.activity_id,
-                    op_date=item.op_date,
-                    window_start=item.window_start,
-                    window_end=item.window_end,
-                    quantity=item.quantity,
-                    workload_minutes=item.workload_minutes,
-                    priority=item.priority,
-                    source=item.source,
-                    drivers_json=item.drivers_json,
-                    notes=item.notes,
-                    created_by=created_by
+            # Cópia dos itens inteiramente no banco: INSERT ... SELECT, sem trazer linhas para a aplicação.
+            copied_columns = [
+                "sector_id", "activity_id", "op_date", "window_start", "window_end",
+                "quantity", "workload_minutes", "priority", "source", "drivers_json", "notes"
+            ]
+            db.execute(
+                insert(ActivityProgramItem).from_select(
+                    ["program_week_id", *copied_columns, "created_by"],
+                    select(
+                        literal(new_program.id),
+                        *(getattr(ActivityProgramItem, c) for c in copied_columns),
+                        literal(created_by)
+                    ).where(ActivityProgramItem.program_week_id == original_program.id)
                 )
-                db.add(new_item)
+            )
         
         db.commit()
         
@@ -619,7 +746,19 @@ class ActivityProgramService:
         week_start: date,
         forecast_run_id: int
     ) -> Dict[str, Any]:
-        program_week = db.query(ActivityProgramWeek).filter(
+        # Itens e nomes das atividades em duas consultas extras, só com as colunas usadas abaixo.
+        program_week = db.query(ActivityProgramWeek).options(
+            load_only(ActivityProgramWeek.id, ActivityProgramWeek.status),
+            selectinload(ActivityProgramWeek.items).load_only(
+                ActivityProgramItem.activity_id,
+                ActivityProgramItem.op_date,
+                ActivityProgramItem.quantity,
+                ActivityProgramItem.workload_minutes,
+                ActivityProgramItem.window_start,
+                ActivityProgramItem.window_end,
+                ActivityProgramItem.priority
+            ).selectinload(ActivityProgramItem.activity).load_only(GovernanceActivity.name)
+        ).filter(
             ActivityProgramWeek.sector_id == sector_id,
             ActivityProgramWeek.forecast_run_id == forecast_run_id,
             ActivityProgramWeek.week_start == week_start
@@ -628,15 +767,11 @@ class ActivityProgramService:
         if not program_week:
             return {"error": "Program not found", "items_by_day": {}}
         
-        items_by_day = {}
-        total_workload = 0
+        items = program_week.items
+        items_by_day = defaultdict(list)
         
-        for item in program_week.items:
-            day_key = item.op_date.isoformat()
-            if day_key not in items_by_day:
-                items_by_day[day_key] = []
-            
-            items_by_day[day_key].append({
+        for item in items:
+            items_by_day[item.op_date.isoformat()].append({
                 "activity_id": item.activity_id,
                 "activity_name": item.activity.name if item.activity else None,
                 "quantity": item.quantity,
@@ -645,11 +780,10 @@ class ActivityProgramService:
                 "window_end": item.window_end.isoformat() if item.window_end else None,
                 "priority": item.priority
             })
-            total_workload += item.workload_minutes or 0
         
         return {
             "program_week_id": program_week.id,
             "status": program_week.status.value,
-            "items_by_day": items_by_day,
-            "total_workload_minutes": total_workload
+            "items_by_day": dict(items_by_day),
+            "total_workload_minutes": sum(item.workload_minutes or 0 for item in items)
         }
@@ -7,11 +7,13 @@ respeitando capacidades individuais e regras de alternância.
 Versão: 1.0.0
 """
 
+import heapq
+import os
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from collections import deque
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from collections import defaultdict, deque
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+from sqlalchemy import and_, insert
 
 from app.models.governance_module import (
     HousekeepingSchedulePlan, ShiftSlot, SchedulePlanStatus,
@@ -22,13 +24,17 @@ from app.models.governance_activity import (
     GovernanceActivity, ActivityClassification, WorkloadDriver
 )
 from app.models.activity_program import ActivityProgramWeek, ActivityProgramItem
-from app.models.employee import Employee
 from app.models.agent_run import AgentRun, AgentTraceStep, RunType, RunStatus
 from app.services.rule_engine import RuleEngine
 from app.services.recurrence_expansion_service import expand_recurring_activities
 
 METHOD_VERSION = "1.0.0"
 
+# Blocos de no máximo 1h por atribuição; dificuldade >= 3 entra no rodízio de tarefas difíceis.
+MAX_CHUNK_MINUTES = 60
+DIFFICULT_TASK_LEVEL = 3
+PENDING_REASON = "Agendamento manual necessário"
+
 WEEKDAY_PT = ["SEGUNDA-FEIRA", "TERÇA-FEIRA", "QUARTA-FEIRA", "QUINTA-FEIRA", "SEXTA-FEIRA", "SÁBADO", "DOMINGO"]
 
 
@@ -50,6 +56,8 @@ class AgendaGenerationService:
         self._applied_rules: List[Dict] = []
         self._conflicts: List[Dict] = []
         self._pending_items: List[Dict] = []
+        # AGENDA_TRACE_VERBOSE=1 mantém um passo de trace por bloco atribuído (auditoria/depuração).
+        self._verbose_trace = os.environ.get("AGENDA_TRACE_VERBOSE") == "1"
     
     def generate_agendas(
         self,
@@ -89,11 +97,16 @@ class AgendaGenerationService:
                 "error": "Plano de escala não pertence ao setor informado"
             }
         
-        assigned_slots = self.db.query(ShiftSlot).filter(
+        assigned_slots = self.db.query(ShiftSlot).options(
+            load_only(
+                ShiftSlot.id, ShiftSlot.target_date, ShiftSlot.employee_id,
+                ShiftSlot.hours_worked, ShiftSlot.start_time, ShiftSlot.end_time
+            )
+        ).filter(
             ShiftSlot.schedule_plan_id == schedule_plan_id,
             ShiftSlot.is_assigned == True,
             ShiftSlot.employee_id.isnot(None)
-        ).all()
+        ).order_by(ShiftSlot.target_date, ShiftSlot.employee_id).all()
         
         if not assigned_slots:
             return {
@@ -107,14 +120,16 @@ class AgendaGenerationService:
         })
         
         rules = self.rule_engine.fetch_rules(sector_id)
+        calculation_rules = [r for group in rules.calculation.values() for r in group]
+        operational_rules = [r for group in rules.operational.values() for r in group]
         self._applied_rules = [
-            {"codigo": r.codigo_regra, "tipo": r.tipo.value, "nivel": r.nivel_rigidez.value}
-            for r in (rules.get("CALCULATION", []) + rules.get("OPERATIONAL", []))[:10]
+            {"codigo": r.codigo_regra, "tipo": r.tipo_regra.value, "nivel": r.nivel_rigidez.value}
+            for r in (calculation_rules + operational_rules)[:10]
         ]
         
         self._add_trace("LOAD_RULES", {
-            "calculation_rules": len(rules.get("CALCULATION", [])),
-            "operational_rules": len(rules.get("OPERATIONAL", []))
+            "calculation_rules": len(calculation_rules),
+            "operational_rules": len(operational_rules)
         })
         
         week_end = week_start + timedelta(days=6)
@@ -126,46 +141,53 @@ class AgendaGenerationService:
             "eventuais": len(activities_by_type.get("EVENTUAL", []))
         })
         
-        demand_by_day = self._load_demand_by_day(sector_id, week_start, week_end)
+        recorrentes_by_day: Dict[date, List[Dict]] = defaultdict(list)
+        for act in activities_by_type.get("RECORRENTE", []):
+            for d in act.get("dates", []):
+                recorrentes_by_day[d].append(act)
+        
+        demand_by_day = self._load_demand_by_day(schedule_plan.forecast_run_id, week_start, week_end)
         
+        # Itens saem pelo ON DELETE CASCADE da FK agenda_id.
         self.db.query(EmployeeDailyAgenda).filter(
             EmployeeDailyAgenda.schedule_plan_id == schedule_plan_id
-        ).delete()
-        self.db.flush()
+        ).delete(synchronize_session=False)
         
-        slots_by_day: Dict[date, List[ShiftSlot]] = {}
+        slots_by_day: Dict[date, List[ShiftSlot]] = defaultdict(list)
         for slot in assigned_slots:
-            if slot.target_date not in slots_by_day:
-                slots_by_day[slot.target_date] = []
             slots_by_day[slot.target_date].append(slot)
         
-        agendas_created = []
+        agendas_count = 0
+        per_day_summary: List[Dict] = []
         
-        for target_date, day_slots in sorted(slots_by_day.items()):
-            day_agendas = self._generate_day_agendas(
+        # Slots já vêm ordenados por (data, colaborador): dias e listas do dia saem em ordem.
+        for target_date, day_slots in slots_by_day.items():
+            day_agendas, day_summary = self._generate_day_agendas(
                 sector_id=sector_id,
                 schedule_plan_id=schedule_plan_id,
                 target_date=target_date,
                 day_slots=day_slots,
                 activities_by_type=activities_by_type,
+                recorrentes_by_day=recorrentes_by_day,
                 demand_by_day=demand_by_day
             )
-            agendas_created.extend(day_agendas)
-        
-        self.db.commit()
+            agendas_count += len(day_agendas)
+            per_day_summary.append(day_summary)
         
         agent_run = self._record_agent_run(
             sector_id=sector_id,
             week_start=week_start,
             schedule_plan_id=schedule_plan_id,
-            agendas_count=len(agendas_created)
+            agendas_count=agendas_count
         )
         
+        self.db.commit()
+        
         return {
             "success": True,
             "method_version": METHOD_VERSION,
-            "agendas_geradas": len(agendas_created),
-            "por_dia": self._summarize_by_day(agendas_created),
+            "agendas_geradas": agendas_count,
+            "por_dia": per_day_summary,
             "conflitos": self._conflicts,
             "pendencias": self._pending_items,
             "trace": self._trace_steps,
@@ -192,23 +214,26 @@ class AgendaGenerationService:
             "EVENTUAL": []
         }
         
+        # Expansão das recorrentes da semana feita uma única vez e indexada por atividade.
+        dates_by_activity: Dict[int, List[date]] = defaultdict(list)
+        if any(act.classificacao_atividade == ActivityClassification.RECORRENTE for act in activities):
+            iso_year, iso_week, _ = week_start.isocalendar()
+            for exp in expand_recurring_activities(self.db, sector_id, iso_year, iso_week):
+                dates_by_activity[exp["activity_id"]].append(exp["date"])
+        
         for act in activities:
             classification = act.classificacao_atividade.value if act.classificacao_atividade else "CALCULADA_PELO_AGENTE"
             
             if classification == "RECORRENTE":
-                expanded = expand_recurring_activities(
-                    self.db, sector_id, week_start, week_end
-                )
-                for exp in expanded:
-                    if exp.get("activity_id") == act.id:
-                        result["RECORRENTE"].append({
-                            "activity_id": act.id,
-                            "name": act.name,
-                            "code": act.code,
-                            "minutes": act.average_time_minutes,
-                            "difficulty": act.difficulty_level,
-                            "dates": exp.get("scheduled_dates", [])
-                        })
+                if act.id in dates_by_activity:
+                    result["RECORRENTE"].append({
+                        "activity_id": act.id,
+                        "name": act.name,
+                        "code": act.code,
+                        "minutes": act.average_time_minutes,
+                        "difficulty": act.difficulty_level,
+                        "dates": dates_by_activity[act.id]
+                    })
             else:
                 result[classification].append({
                     "activity_id": act.id,
@@ -223,24 +248,40 @@ class AgendaGenerationService:
     
     def _load_demand_by_day(
         self,
-        sector_id: int,
+        forecast_run_id: Optional[int],
         week_start: date,
         week_end: date
     ) -> Dict[date, Dict]:
-        """Carrega demanda calculada por dia."""
-        
-        demands = self.db.query(HousekeepingDemandDaily).filter(
-            HousekeepingDemandDaily.sector_id == sector_id,
+        """
+        Carrega demanda calculada por dia a partir do forecast da escala.
+        A divisão variável/constante vem do breakdown gravado pelo cálculo de demanda.
+        """
+        if not forecast_run_id:
+            return {}
+        
+        demands = self.db.query(
+            HousekeepingDemandDaily.target_date,
+            HousekeepingDemandDaily.minutes_required_raw,
+            HousekeepingDemandDaily.calculation_breakdown
+        ).filter(
+            HousekeepingDemandDaily.forecast_run_id == forecast_run_id,
             HousekeepingDemandDaily.target_date >= week_start,
             HousekeepingDemandDaily.target_date <= week_end
         ).all()
         
         result = {}
         for d in demands:
+            calculations = (d.calculation_breakdown or {}).get("calculations", {})
+            if "minutes_variable" in calculations:
+                variable_minutes = calculations.get("minutes_variable") or 0
+                constant_minutes = calculations.get("minutes_constant") or 0
+            else:
+                variable_minutes = d.minutes_required_raw or 0
+                constant_minutes = 0
             result[d.target_date] = {
-                "variable_minutes": d.total_minutes_demand or 0,
-                "constant_minutes": d.constant_activities_minutes or 0,
-                "total_minutes": (d.total_minutes_demand or 0) + (d.constant_activities_minutes or 0)
+                "variable_minutes": variable_minutes,
+                "constant_minutes": constant_minutes,
+                "total_minutes": variable_minutes + constant_minutes
             }
         
         return result
@@ -252,16 +293,16 @@ class AgendaGenerationService:
         target_date: date,
         day_slots: List[ShiftSlot],
         activities_by_type: Dict[str, List[Dict]],
+        recorrentes_by_day: Dict[date, List[Dict]],
         demand_by_day: Dict[date, Dict]
-    ) -> List[EmployeeDailyAgenda]:
-        """Gera agendas para um dia específico."""
+    ) -> Tuple[List[Any], Dict]:
+        """Gera agendas para um dia específico e devolve também o resumo do dia."""
         
         day_demand = demand_by_day.get(target_date, {})
         total_demand_minutes = day_demand.get("total_minutes", 0)
         
-        total_capacity_minutes = sum(
-            int((slot.hours_worked or 8.0) * 60) for slot in day_slots
-        )
+        slot_capacity: Dict[int, int] = {s.employee_id: int((s.hours_worked or 8.0) * 60) for s in day_slots}
+        total_capacity_minutes = sum(slot_capacity.values())
         
         has_conflict = total_demand_minutes > total_capacity_minutes
         if has_conflict:
@@ -272,18 +313,15 @@ class AgendaGenerationService:
             })
         
         calculadas = activities_by_type.get("CALCULADA_PELO_AGENTE", [])
-        recorrentes = [
-            r for r in activities_by_type.get("RECORRENTE", [])
-            if target_date.isoformat() in [str(d) for d in r.get("dates", [])]
-        ]
+        recorrentes = recorrentes_by_day.get(target_date, [])
         eventuais = activities_by_type.get("EVENTUAL", [])
         
         all_activities = []
+        variable_proportion = day_demand.get("variable_minutes", 0) / max(total_demand_minutes, 1)
         
         for act in calculadas:
             if act.get("workload_driver") == "VARIABLE":
-                proportion = day_demand.get("variable_minutes", 0) / max(total_demand_minutes, 1)
-                minutes = int(act.get("minutes", 0) * proportion * len(day_slots))
+                minutes = int(act.get("minutes", 0) * variable_proportion * len(day_slots))
             else:
                 minutes = int(act.get("minutes", 0))
             
@@ -316,101 +354,118 @@ class AgendaGenerationService:
                 "reason": "Atividade EVENTUAL - agendamento manual necessário"
             })
         
-        agendas = []
+        agendas: List[Dict] = []
+        agenda_by_emp: Dict[int, Dict] = {}
+        agenda_items: Dict[int, List[Dict]] = {}
+        slot_position: Dict[int, int] = {s.employee_id: idx for idx, s in enumerate(day_slots)}
         employee_loads: Dict[int, int] = {slot.employee_id: 0 for slot in day_slots}
         employee_last_difficulty: Dict[int, int] = {slot.employee_id: 0 for slot in day_slots}
         
-        difficult_rotation_queue = deque([slot.employee_id for slot in sorted(day_slots, key=lambda s: s.employee_id)])
+        # Heap (carga, posição do slot, colaborador) só com quem ainda tem capacidade;
+        # entradas com carga desatualizada são descartadas ao chegar ao topo.
+        load_heap: List[Tuple[int, int, int]] = [
+            (0, idx, s.employee_id) for idx, s in enumerate(day_slots) if slot_capacity[s.employee_id] > 0
+        ]
+        heapq.heapify(load_heap)
+        
+        # Tarefas difíceis vão para quem recebeu menos blocos difíceis no dia (contador de
+        # déficit); quem esgota a capacidade sai do heap de vez, já que a carga só cresce.
+        difficult_heap: List[Tuple[int, int]] = [(0, slot.employee_id) for slot in day_slots]
         
+        # Agendas e itens são montados em memória e gravados em lote no fim do dia.
         for slot in day_slots:
-            minutes_available = int((slot.hours_worked or 8.0) * 60)
-            
-            agenda = EmployeeDailyAgenda(
-                schedule_plan_id=schedule_plan_id,
-                shift_slot_id=slot.id,
-                employee_id=slot.employee_id,
-                sector_id=sector_id,
-                target_date=target_date,
-                total_minutes_available=minutes_available,
-                shift_start=slot.start_time,
-                shift_end=slot.end_time,
-                status=AgendaGenerationStatus.GENERATED,
-                has_conflict=has_conflict
-            )
-            self.db.add(agenda)
-            self.db.flush()
+            agenda = {
+                "schedule_plan_id": schedule_plan_id,
+                "shift_slot_id": slot.id,
+                "employee_id": slot.employee_id,
+                "sector_id": sector_id,
+                "target_date": target_date,
+                "total_minutes_available": slot_capacity[slot.employee_id],
+                "total_minutes_allocated": 0,
+                "shift_start": slot.start_time,
+                "shift_end": slot.end_time,
+                "status": AgendaGenerationStatus.GENERATED,
+                "has_conflict": has_conflict
+            }
             agendas.append(agenda)
+            agenda_by_emp[slot.employee_id] = agenda
+            agenda_items[slot.employee_id] = []
+        
+        # Sem trace detalhado, as atribuições do dia são resumidas no passo GENERATE_DAY.
+        assignments_count = 0
+        minutes_per_difficulty: Dict[str, int] = {}
+        rotations_used = 0
         
         for activity in all_activities:
             remaining = activity.get("total_minutes", 0)
             is_pending_activity = activity.get("is_pending", False)
+            activity_id = activity.get("activity_id")
+            activity_unit_minutes = max(activity.get("minutes", 1), 1)
+            activity_classification = activity.get("classification", "CALCULADA_PELO_AGENTE")
+            pending_reason = PENDING_REASON if is_pending_activity else None
+            activity_difficulty = activity.get("difficulty", 1)
+            is_difficult_task = activity_difficulty >= DIFFICULT_TASK_LEVEL
             
             while remaining > 0:
-                eligible_slots = [
-                    s for s in day_slots
-                    if employee_loads.get(s.employee_id, 0) < int((s.hours_worked or 8.0) * 60)
-                ]
+                while load_heap and load_heap[0][0] != employee_loads[load_heap[0][2]]:
+                    heapq.heappop(load_heap)
                 
-                if not eligible_slots:
+                if not load_heap:
                     break
                 
-                activity_difficulty = activity.get("difficulty", 1)
-                is_difficult_task = activity_difficulty >= 3
-                
                 if is_difficult_task:
                     chosen_emp_id = None
-                    attempts = 0
-                    while attempts < len(difficult_rotation_queue):
-                        candidate = difficult_rotation_queue[0]
-                        
-                        candidate_slot = next((s for s in eligible_slots if s.employee_id == candidate), None)
-                        if candidate_slot:
+                    while difficult_heap:
+                        deficit, candidate = heapq.heappop(difficult_heap)
+                        if employee_loads[candidate] < slot_capacity[candidate]:
                             chosen_emp_id = candidate
-                            difficult_rotation_queue.rotate(-1)
+                            heapq.heappush(difficult_heap, (deficit + 1, candidate))
                             break
-                        difficult_rotation_queue.rotate(-1)
-                        attempts += 1
                     
-                    if chosen_emp_id:
-                        chosen_slot = next(s for s in day_slots if s.employee_id == chosen_emp_id)
-                    else:
-                        eligible_slots.sort(key=lambda s: employee_loads.get(s.employee_id, 0))
-                        chosen_slot = eligible_slots[0]
+                    if chosen_emp_id is None:
+                        chosen_emp_id = load_heap[0][2]
                 else:
-                    eligible_slots.sort(key=lambda s: (
-                        employee_loads.get(s.employee_id, 0),
-                        abs(employee_last_difficulty.get(s.employee_id, 0) - activity_difficulty)
+                    # Entre os de menor carga, prefere quem fez a dificuldade mais próxima.
+                    min_load = load_heap[0][0]
+                    ties = []
+                    while load_heap and load_heap[0][0] == min_load:
+                        entry = heapq.heappop(load_heap)
+                        if entry[0] == employee_loads[entry[2]]:
+                            ties.append(entry)
+                    chosen = min(ties, key=lambda e: (
+                        abs(employee_last_difficulty[e[2]] - activity_difficulty), e[1]
                     ))
-                    chosen_slot = eligible_slots[0]
+                    for entry in ties:
+                        if entry is not chosen:
+                            heapq.heappush(load_heap, entry)
+                    chosen_emp_id = chosen[2]
                 
-                emp_id = chosen_slot.employee_id
+                emp_id = chosen_emp_id
                 
-                capacity_left = int((chosen_slot.hours_worked or 8.0) * 60) - employee_loads.get(emp_id, 0)
-                assign_minutes = min(remaining, capacity_left, 60)
+                capacity_left = slot_capacity[emp_id] - employee_loads[emp_id]
+                assign_minutes = min(remaining, capacity_left, MAX_CHUNK_MINUTES)
                 
                 if assign_minutes <= 0:
                     break
                 
-                agenda = next((a for a in agendas if a.employee_id == emp_id), None)
-                if agenda:
-                    item_order = len([i for i in agenda.items]) + 1 if hasattr(agenda, 'items') else 1
-                    
-                    item = EmployeeDailyAgendaItem(
-                        agenda_id=agenda.id,
-                        activity_id=activity.get("activity_id"),
-                        order=item_order,
-                        minutes=assign_minutes,
-                        quantity=assign_minutes / max(activity.get("minutes", 1), 1),
-                        classification=activity.get("classification", "CALCULADA_PELO_AGENTE"),
-                        is_pending=is_pending_activity,
-                        pending_reason="Agendamento manual necessário" if is_pending_activity else None
-                    )
-                    self.db.add(item)
-                    
-                    agenda.total_minutes_allocated = (agenda.total_minutes_allocated or 0) + assign_minutes
-                    employee_loads[emp_id] = employee_loads.get(emp_id, 0) + assign_minutes
-                    employee_last_difficulty[emp_id] = activity.get("difficulty", 1)
-                    
+                items = agenda_items[emp_id]
+                items.append({
+                    "activity_id": activity_id,
+                    "order": len(items) + 1,
+                    "minutes": assign_minutes,
+                    "quantity": assign_minutes / activity_unit_minutes,
+                    "classification": activity_classification,
+                    "is_pending": is_pending_activity,
+                    "pending_reason": pending_reason
+                })
+                
+                agenda_by_emp[emp_id]["total_minutes_allocated"] += assign_minutes
+                employee_loads[emp_id] += assign_minutes
+                employee_last_difficulty[emp_id] = activity_difficulty
+                if employee_loads[emp_id] < slot_capacity[emp_id]:
+                    heapq.heappush(load_heap, (employee_loads[emp_id], slot_position[emp_id], emp_id))
+                
+                if self._verbose_trace:
                     self._add_trace("ASSIGN_ACTIVITY", {
                         "date": target_date.isoformat(),
                         "employee_id": emp_id,
@@ -421,46 +476,58 @@ class AgendaGenerationService:
                         "is_pending": is_pending_activity,
                         "employee_load_after": employee_loads[emp_id],
                         "rotation_used": is_difficult_task,
-                        "queue_state": list(difficult_rotation_queue)[:5] if is_difficult_task else None
+                        "queue_state": [e for _, e in heapq.nsmallest(5, difficult_heap)] if is_difficult_task else None
                     })
+                else:
+                    assignments_count += 1
+                    difficulty_key = str(activity_difficulty)
+                    minutes_per_difficulty[difficulty_key] = minutes_per_difficulty.get(difficulty_key, 0) + assign_minutes
+                    if is_difficult_task:
+                        rotations_used += 1
                 
                 remaining -= assign_minutes
         
-        self.db.flush()
-        
         if eventual_items_for_pending and agendas:
-            eventual_queue = deque([a.employee_id for a in agendas])
+            eventual_queue = deque([a["employee_id"] for a in agendas])
             for ev_item in eventual_items_for_pending:
                 target_emp = eventual_queue[0]
                 eventual_queue.rotate(-1)
                 
-                target_agenda = next((a for a in agendas if a.employee_id == target_emp), None)
-                if target_agenda:
-                    item_order = len([i for i in target_agenda.items]) + 1 if hasattr(target_agenda, 'items') else 1
-                    
-                    pending_item = EmployeeDailyAgendaItem(
-                        agenda_id=target_agenda.id,
-                        activity_id=ev_item.get("activity_id"),
-                        order=item_order,
-                        minutes=int(ev_item.get("minutes", 0)),
-                        quantity=1.0,
-                        classification="EVENTUAL",
-                        is_pending=True,
-                        pending_reason="Agendamento manual necessário"
-                    )
-                    self.db.add(pending_item)
-                    
-                    self._add_trace("ASSIGN_PENDING", {
-                        "date": target_date.isoformat(),
-                        "employee_id": target_emp,
-                        "activity": ev_item.get("name"),
-                        "classification": "EVENTUAL",
-                        "is_pending": True
-                    })
-            
-            self.db.flush()
+                items = agenda_items[target_emp]
+                items.append({
+                    "activity_id": ev_item.get("activity_id"),
+                    "order": len(items) + 1,
+                    "minutes": int(ev_item.get("minutes", 0)),
+                    "quantity": 1.0,
+                    "classification": "EVENTUAL",
+                    "is_pending": True,
+                    "pending_reason": PENDING_REASON
+                })
+                
+                self._add_trace("ASSIGN_PENDING", {
+                    "date": target_date.isoformat(),
+                    "employee_id": target_emp,
+                    "activity": ev_item.get("name"),
+                    "classification": "EVENTUAL",
+                    "is_pending": True
+                })
+        
+        created = self.db.execute(
+            insert(EmployeeDailyAgenda).returning(
+                EmployeeDailyAgenda.id, EmployeeDailyAgenda.employee_id, sort_by_parameter_order=True
+            ),
+            agendas
+        ).all() if agendas else []
+        
+        item_rows = [
+            {**item, "agenda_id": agenda.id}
+            for agenda in created
+            for item in agenda_items[agenda.employee_id]
+        ]
+        if item_rows:
+            self.db.bulk_insert_mappings(EmployeeDailyAgendaItem, item_rows)
         
-        self._add_trace("GENERATE_DAY", {
+        day_trace = {
             "date": target_date.isoformat(),
             "employees": len(day_slots),
             "activities_distributed": len(all_activities),
@@ -468,32 +535,24 @@ class AgendaGenerationService:
             "total_demand": total_demand_minutes,
             "total_capacity": total_capacity_minutes,
             "has_conflict": has_conflict
-        })
-        
-        return agendas
-    
-    def _summarize_by_day(self, agendas: List[EmployeeDailyAgenda]) -> List[Dict]:
-        """Resume agendas por dia."""
-        by_day: Dict[date, Dict] = {}
+        }
+        if not self._verbose_trace:
+            day_trace.update({
+                "assignments": assignments_count,
+                "minutes_per_difficulty": minutes_per_difficulty,
+                "rotations_used": rotations_used
+            })
+        self._add_trace("GENERATE_DAY", day_trace)
         
-        for agenda in agendas:
-            d = agenda.target_date
-            if d not in by_day:
-                by_day[d] = {
-                    "date": d.isoformat(),
-                    "employees": 0,
-                    "total_allocated": 0,
-                    "total_available": 0,
-                    "conflicts": 0
-                }
-            
-            by_day[d]["employees"] += 1
-            by_day[d]["total_allocated"] += agenda.total_minutes_allocated or 0
-            by_day[d]["total_available"] += agenda.total_minutes_available or 0
-            if agenda.has_conflict:
-                by_day[d]["conflicts"] += 1
+        day_summary = {
+            "date": target_date.isoformat(),
+            "employees": len(agendas),
+            "total_allocated": sum(a["total_minutes_allocated"] for a in agendas),
+            "total_available": total_capacity_minutes,
+            "conflicts": len(agendas) if has_conflict else 0
+        }
         
-        return list(sorted(by_day.values(), key=lambda x: x["date"]))
+        return created, day_summary
     
     def _add_trace(self, step: str, data: Dict):
         """Adiciona passo ao trace."""
@@ -509,38 +568,45 @@ class AgendaGenerationService:
         schedule_plan_id: int,
         agendas_count: int
     ) -> Optional[AgentRun]:
-        """Registra execução do agente."""
+        """
+        Registra execução do agente.
+        
+        Gravado num savepoint: falha no trace desfaz só o registro da execução,
+        sem invalidar a transação das agendas que ainda será confirmada.
+        """
         try:
-            agent_run = AgentRun(
-                run_type=RunType.SCHEDULE,
-                setor_id=sector_id,
-                week_start=week_start,
-                status=RunStatus.SUCCESS,
-                inputs_snapshot={
-                    "schedule_plan_id": schedule_plan_id,
-                    "method_version": METHOD_VERSION,
-                    "operation": "AGENDA_GENERATION"
-                },
-                outputs_summary={
-                    "agendas_geradas": agendas_count,
-                    "conflitos": len(self._conflicts),
-                    "pendencias": len(self._pending_items)
-                }
-            )
-            self.db.add(agent_run)
-            self.db.flush()
-            
-            for i, step in enumerate(self._trace_steps):
-                trace_step = AgentTraceStep(
-                    run_id=agent_run.id,
-                    step_order=i + 1,
-                    step_key=step.get("step", "UNKNOWN"),
-                    description=str(step)[:500],
-                    applied_rules=self._applied_rules if step.get("step") == "LOAD_RULES" else [],
-                    calculations=step,
-                    constraints_violated=[]
+            with self.db.begin_nested():
+                agent_run = AgentRun(
+                    run_type=RunType.SCHEDULE,
+                    setor_id=sector_id,
+                    week_start=week_start,
+                    status=RunStatus.SUCCESS,
+                    inputs_snapshot={
+                        "schedule_plan_id": schedule_plan_id,
+                        "method_version": METHOD_VERSION,
+                        "operation": "AGENDA_GENERATION"
+                    },
+                    outputs_summary={
+                        "agendas_geradas": agendas_count,
+                        "conflitos": len(self._conflicts),
+                        "pendencias": len(self._pending_items)
+                    }
                 )
-                self.db.add(trace_step)
+                self.db.add(agent_run)
+                self.db.flush()
+                
+                self.db.bulk_insert_mappings(AgentTraceStep, [
+                    {
+                        "run_id": agent_run.id,
+                        "step_order": i + 1,
+                        "step_key": step.get("step", "UNKNOWN"),
+                        "description": str(step)[:500],
+                        "applied_rules": self._applied_rules if step.get("step") == "LOAD_RULES" else [],
+                        "calculations": step,
+                        "constraints_violated": []
+                    }
+                    for i, step in enumerate(self._trace_steps)
+                ])
             
             return agent_run
         except Exception as e:
@@ -564,7 +630,10 @@ class AgendaGenerationService:
         """
         week_end = week_start + timedelta(days=6)
         
-        agendas = self.db.query(EmployeeDailyAgenda).filter(
+        agendas = self.db.query(EmployeeDailyAgenda).options(
+            joinedload(EmployeeDailyAgenda.employee),
+            selectinload(EmployeeDailyAgenda.items).joinedload(EmployeeDailyAgendaItem.activity)
+        ).filter(
             EmployeeDailyAgenda.sector_id == sector_id,
             EmployeeDailyAgenda.target_date >= week_start,
             EmployeeDailyAgenda.target_date <= week_end
@@ -579,17 +648,11 @@ class AgendaGenerationService:
         
         result = []
         for agenda in agendas:
-            employee = self.db.query(Employee).filter(Employee.id == agenda.employee_id).first()
-            
-            items = self.db.query(EmployeeDailyAgendaItem).filter(
-                EmployeeDailyAgendaItem.agenda_id == agenda.id
-            ).order_by(EmployeeDailyAgendaItem.order).all()
+            employee = agenda.employee
             
             activities_list = []
-            for item in items:
-                activity = self.db.query(GovernanceActivity).filter(
-                    GovernanceActivity.id == item.activity_id
-                ).first()
+            for item in agenda.items:
+                activity = item.activity
                 
                 activities_list.append({
                     "order": item.order,
@@ -1,7 +1,7 @@
 from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, case, insert, update
 
 from app.models.convocation import Convocation, ConvocationStatus, ConvocationOrigin
 from app.models.employee import Employee, ContractType
@@ -10,8 +10,7 @@ from app.models.daily_shift import DailyShift
 from app.models.weekly_schedule import WeeklySchedule, ScheduleStatus
 from app.models.governance_activity import GovernanceActivity, RoleActivity
 from app.models.audit_log import AuditLog, AuditAction
-from app.models.governance_rules import GovernanceRules
-from app.legal_rules.intermittent_rules import IntermittentWorkerRules, LegalConfig
+from app.legal_rules.intermittent_rules import IntermittentWorkerRules
 
 
 class ConvocationService:
@@ -20,21 +19,6 @@ class ConvocationService:
         self.db = db
         self.legal_rules = IntermittentWorkerRules()
     
-    def _get_governance_rules(self) -> Optional[GovernanceRules]:
-        return self.db.query(GovernanceRules).filter(
-            GovernanceRules.is_active == True
-        ).first()
-    
-    def _get_legal_config(self) -> LegalConfig:
-        rules = self._get_governance_rules()
-        if rules:
-            return LegalConfig(
-                min_convocation_hours=72,
-                max_daily_hours=rules.limite_horas_diarias or 10.0,
-                max_weekly_hours=rules.limite_horas_semanais_sem_extra or 44.0
-            )
-        return LegalConfig()
-    
     def validate_convocation(
         self,
         employee_id: int,
@@ -43,8 +27,44 @@ class ConvocationService:
         start_time: time,
         end_time: time,
         total_hours: float,
-        convocation_datetime: Optional[datetime] = None
+        convocation_datetime: Optional[datetime] = None,
+        fast_fail: bool = False
     ) -> Dict:
+        """
+        Por padrão devolve o relatório completo de verificações. Com fast_fail,
+        se antecedência ou jornada diária já falharem, retorna sem consultar as
+        convocações existentes (útil quando só importa se a convocação é válida).
+        """
+        employee = self.db.query(Employee).filter(Employee.id == employee_id).first()
+        if not employee:
+            return {
+                "is_valid": False,
+                "errors": [f"Colaborador {employee_id} não encontrado"],
+                "warnings": [],
+                "checks": []
+            }
+        
+        return self._validate_convocation_for_employee(
+            employee=employee,
+            sector_id=sector_id,
+            conv_date=conv_date,
+            start_time=start_time,
+            total_hours=total_hours,
+            convocation_datetime=convocation_datetime,
+            fast_fail=fast_fail
+        )
+    
+    def _validate_convocation_for_employee(
+        self,
+        employee: Employee,
+        sector_id: int,
+        conv_date: date,
+        start_time: time,
+        total_hours: float,
+        convocation_datetime: Optional[datetime] = None,
+        fast_fail: bool = False
+    ) -> Dict:
+        """Mesma validação de validate_convocation para um colaborador já carregado."""
         result = {
             "is_valid": True,
             "errors": [],
@@ -52,25 +72,72 @@ class ConvocationService:
             "checks": []
         }
         
-        employee = self.db.query(Employee).filter(Employee.id == employee_id).first()
-        if not employee:
-            result["is_valid"] = False
-            result["errors"].append(f"Colaborador {employee_id} não encontrado")
+        if not self._check_employee(employee, sector_id, result):
             return result
         
+        self._apply_static_checks(
+            result=result,
+            conv_date=conv_date,
+            start_time=start_time,
+            total_hours=total_hours,
+            convocation_datetime=convocation_datetime
+        )
+        if fast_fail and not result["is_valid"]:
+            return result
+        
+        week_start = conv_date - timedelta(days=conv_date.weekday())
+        week_end = week_start + timedelta(days=6)
+        
+        existing_weekly_hours = self.db.query(
+            func.coalesce(func.sum(Convocation.total_hours), 0.0)
+        ).filter(
+            Convocation.employee_id == employee.id,
+            Convocation.date >= week_start,
+            Convocation.date <= week_end,
+            Convocation.status.in_([ConvocationStatus.PENDING, ConvocationStatus.ACCEPTED])
+        ).scalar()
+        
+        has_same_day_convocation = self.db.query(Convocation.id).filter(
+            Convocation.employee_id == employee.id,
+            Convocation.date == conv_date,
+            Convocation.status.in_([ConvocationStatus.PENDING, ConvocationStatus.ACCEPTED])
+        ).first() is not None
+        
+        return self._apply_history_checks(
+            result=result,
+            employee=employee,
+            conv_date=conv_date,
+            total_hours=total_hours,
+            existing_weekly_hours=existing_weekly_hours,
+            has_same_day_convocation=has_same_day_convocation
+        )
+    
+    def _check_employee(self, employee: Employee, sector_id: int, result: Dict) -> bool:
+        """Verifica situação e contrato do colaborador; retorna False se bloqueado."""
         if not employee.is_active:
             result["is_valid"] = False
             result["errors"].append(f"Colaborador {employee.name} está inativo")
-            return result
+            return False
         
         if employee.contract_type != ContractType.INTERMITTENT:
             result["is_valid"] = False
             result["errors"].append(f"Colaborador {employee.name} não é trabalhador intermitente (contrato: {employee.contract_type.value})")
-            return result
+            return False
         
         if employee.sector_id != sector_id:
             result["warnings"].append(f"Colaborador pertence a outro setor (ID: {employee.sector_id})")
         
+        return True
+    
+    def _apply_static_checks(
+        self,
+        result: Dict,
+        conv_date: date,
+        start_time: time,
+        total_hours: float,
+        convocation_datetime: Optional[datetime] = None
+    ) -> Dict:
+        """Antecedência e jornada diária: não dependem do histórico do colaborador."""
         conv_datetime = convocation_datetime or datetime.now()
         shift_datetime = datetime.combine(conv_date, start_time)
         
@@ -88,17 +155,32 @@ class ConvocationService:
             result["is_valid"] = False
             result["errors"].append(hours_check["message"])
         
-        week_start = conv_date - timedelta(days=conv_date.weekday())
-        week_end = week_start + timedelta(days=6)
-        
-        existing_convocations = self.db.query(Convocation).filter(
-            Convocation.employee_id == employee_id,
-            Convocation.date >= week_start,
-            Convocation.date <= week_end,
-            Convocation.status.in_([ConvocationStatus.PENDING, ConvocationStatus.ACCEPTED])
-        ).all()
-        
-        weekly_hours = sum(c.total_hours for c in existing_convocations) + total_hours
+        return result
+    
+    @staticmethod
+    def _merge_static_checks(result: Dict, static_result: Dict) -> Dict:
+        """
+        Copia para result as verificações estáticas já calculadas. Nos lotes,
+        antecedência e jornada diária são avaliadas uma vez por combinação de
+        data/horário/horas e reaproveitadas para todos os colaboradores.
+        """
+        result["checks"].extend(static_result["checks"])
+        if not static_result["is_valid"]:
+            result["is_valid"] = False
+            result["errors"].extend(static_result["errors"])
+        return result
+    
+    def _apply_history_checks(
+        self,
+        result: Dict,
+        employee: Employee,
+        conv_date: date,
+        total_hours: float,
+        existing_weekly_hours: float,
+        has_same_day_convocation: bool
+    ) -> Dict:
+        """Carga semanal, semana de folga e conflito no dia."""
+        weekly_hours = existing_weekly_hours + total_hours
         weekly_check = self.legal_rules.validate_weekly_hours(weekly_hours)
         result["checks"].append({"name": "weekly_hours", "projected_hours": weekly_hours, **weekly_check})
         if not weekly_check["is_valid"]:
@@ -116,18 +198,41 @@ class ConvocationService:
             elif week_off_check.get("approaching_limit"):
                 result["warnings"].append(week_off_check["message"])
         
-        same_day_convocations = self.db.query(Convocation).filter(
-            Convocation.employee_id == employee_id,
-            Convocation.date == conv_date,
-            Convocation.status.in_([ConvocationStatus.PENDING, ConvocationStatus.ACCEPTED])
-        ).all()
-        
-        if same_day_convocations:
+        if has_same_day_convocation:
             result["is_valid"] = False
             result["errors"].append(f"Colaborador já possui convocação para {conv_date}")
         
         return result
     
+    def _load_week_convocations(
+        self,
+        employee_ids: List[int],
+        start_date: date,
+        end_date: date
+    ) -> Tuple[Dict[Tuple[int, date], float], Set[Tuple[int, date]]]:
+        """
+        Carrega numa única query as convocações pendentes/aceitas dos colaboradores
+        no intervalo. Retorna as horas por (colaborador, início da semana) e o
+        conjunto de (colaborador, data) já ocupados.
+        """
+        rows = self.db.query(
+            Convocation.employee_id, Convocation.total_hours, Convocation.date
+        ).filter(
+            Convocation.employee_id.in_(employee_ids),
+            Convocation.date >= start_date,
+            Convocation.date <= end_date,
+            Convocation.status.in_([ConvocationStatus.PENDING, ConvocationStatus.ACCEPTED])
+        ).all()
+        
+        hours_by_week: Dict[Tuple[int, date], float] = {}
+        busy_days: Set[Tuple[int, date]] = set()
+        for employee_id, hours, row_date in rows:
+            week_key = (employee_id, row_date - timedelta(days=row_date.weekday()))
+            hours_by_week[week_key] = hours_by_week.get(week_key, 0) + hours
+            busy_days.add((employee_id, row_date))
+        
+        return hours_by_week, busy_days
+    
     def create_convocation(
         self,
         employee_id: int,
@@ -145,19 +250,36 @@ class ConvocationService:
         break_minutes: int = 60,
         operational_justification: Optional[str] = None,
         replaced_convocation_id: Optional[int] = None,
-        skip_validation: bool = False
+        skip_validation: bool = False,
+        validation: Optional[Dict] = None,
+        employee: Optional[Employee] = None
     ) -> Tuple[Optional[Convocation], Dict]:
         
-        validation = {"is_valid": True, "errors": [], "warnings": []}
+        # Com skip_validation, o chamador pode repassar a validação já feita
+        # para que os campos legal_validation_* continuem corretos
+        if validation is None:
+            validation = {"is_valid": True, "errors": [], "warnings": []}
         
-        if not skip_validation:
+        now = datetime.now()
+        
+        if not skip_validation and employee is not None:
+            validation = self._validate_convocation_for_employee(
+                employee=employee,
+                sector_id=sector_id,
+                conv_date=conv_date,
+                start_time=start_time,
+                total_hours=total_hours,
+                convocation_datetime=now
+            )
+        elif not skip_validation:
             validation = self.validate_convocation(
                 employee_id=employee_id,
                 sector_id=sector_id,
                 conv_date=conv_date,
                 start_time=start_time,
                 end_time=end_time,
-                total_hours=total_hours
+                total_hours=total_hours,
+                convocation_datetime=now
             )
         
         convocation = Convocation(
@@ -175,7 +297,7 @@ class ConvocationService:
             status=ConvocationStatus.PENDING,
             generated_from=generated_from,
             response_deadline=response_deadline,
-            sent_at=datetime.now(),
+            sent_at=now,
             operational_justification=operational_justification,
             replaced_convocation_id=replaced_convocation_id,
             legal_validation_passed=validation["is_valid"],
@@ -206,34 +328,60 @@ class ConvocationService:
         
         return convocation, validation
     
+    def _transition_status(
+        self,
+        convocation_id: int,
+        expected_statuses: List[ConvocationStatus],
+        values: Dict,
+        *criteria
+    ) -> Optional[Convocation]:
+        """
+        Troca de status atômica (compare-and-swap): o UPDATE só afeta a linha se
+        ela ainda estiver num dos status esperados. Retorna None se nada mudou,
+        o que evita duas respostas concorrentes para a mesma convocação.
+        """
+        return self.db.execute(
+            update(Convocation).where(
+                Convocation.id == convocation_id,
+                Convocation.status.in_(expected_statuses),
+                *criteria
+            ).values(**values).returning(Convocation)
+        ).scalars().first()
+    
     def accept_convocation(self, convocation_id: int, response_notes: Optional[str] = None) -> Dict:
-        convocation = self.db.query(Convocation).filter(Convocation.id == convocation_id).first()
+        now = datetime.now()
+        convocation = self._transition_status(
+            convocation_id,
+            [ConvocationStatus.PENDING],
+            {"status": ConvocationStatus.ACCEPTED, "responded_at": now, "response_notes": response_notes},
+            Convocation.response_deadline >= now
+        )
         
         if not convocation:
-            return {"success": False, "error": "Convocação não encontrada"}
-        
-        if convocation.status != ConvocationStatus.PENDING:
-            return {"success": False, "error": f"Convocação não está pendente (status: {convocation.status.value})"}
-        
-        if datetime.now() > convocation.response_deadline:
-            convocation.status = ConvocationStatus.EXPIRED
+            convocation = self.db.query(Convocation).filter(Convocation.id == convocation_id).first()
+            
+            if not convocation:
+                return {"success": False, "error": "Convocação não encontrada"}
+            
+            if convocation.status != ConvocationStatus.PENDING:
+                return {"success": False, "error": f"Convocação não está pendente (status: {convocation.status.value})"}
+            
+            self._transition_status(
+                convocation_id, [ConvocationStatus.PENDING], {"status": ConvocationStatus.EXPIRED}
+            )
             self.db.commit()
             return {"success": False, "error": "Prazo de resposta expirado"}
         
-        convocation.status = ConvocationStatus.ACCEPTED
-        convocation.responded_at = datetime.now()
-        convocation.response_notes = response_notes
-        
-        self.db.commit()
-        
         self._log_audit(
             action=AuditAction.CONVOCATION_ACCEPTED,
             entity_type="convocation",
             entity_id=convocation_id,
             description=f"Convocação aceita pelo colaborador {convocation.employee_id}",
-            new_values={"status": "aceita", "responded_at": convocation.responded_at.isoformat()}
+            new_values={"status": "aceita", "responded_at": now.isoformat()}
         )
         
+        self.db.commit()
+        
         return {"success": True, "convocation": convocation}
     
     def decline_convocation(
@@ -243,21 +391,26 @@ class ConvocationService:
         response_notes: Optional[str] = None,
         auto_reschedule: bool = True
     ) -> Dict:
-        convocation = self.db.query(Convocation).filter(Convocation.id == convocation_id).first()
+        now = datetime.now()
+        convocation = self._transition_status(
+            convocation_id,
+            [ConvocationStatus.PENDING],
+            {
+                "status": ConvocationStatus.DECLINED,
+                "responded_at": now,
+                "decline_reason": decline_reason,
+                "response_notes": response_notes
+            }
+        )
         
         if not convocation:
-            return {"success": False, "error": "Convocação não encontrada"}
-        
-        if convocation.status != ConvocationStatus.PENDING:
+            convocation = self.db.query(Convocation).filter(Convocation.id == convocation_id).first()
+            
+            if not convocation:
+                return {"success": False, "error": "Convocação não encontrada"}
+            
             return {"success": False, "error": f"Convocação não está pendente (status: {convocation.status.value})"}
         
-        convocation.status = ConvocationStatus.DECLINED
-        convocation.responded_at = datetime.now()
-        convocation.decline_reason = decline_reason
-        convocation.response_notes = response_notes
-        
-        self.db.commit()
-        
         self._log_audit(
             action=AuditAction.CONVOCATION_DECLINED,
             entity_type="convocation",
@@ -266,10 +419,12 @@ class ConvocationService:
             new_values={
                 "status": "recusada",
                 "decline_reason": decline_reason,
-                "responded_at": convocation.responded_at.isoformat()
+                "responded_at": now.isoformat()
             }
         )
         
+        self.db.commit()
+        
         result = {"success": True, "convocation": convocation, "reschedule_result": None}
         
         if auto_reschedule:
@@ -287,53 +442,67 @@ class ConvocationService:
         if convocation.status not in [ConvocationStatus.PENDING, ConvocationStatus.ACCEPTED]:
             return {"success": False, "error": f"Não é possível cancelar convocação com status {convocation.status.value}"}
         
-        old_status = convocation.status.value
-        convocation.status = ConvocationStatus.CANCELLED
-        convocation.response_notes = cancellation_reason
+        # O status lido entra na condição do UPDATE: se mudou nesse meio tempo, nada é alterado
+        old_status = convocation.status
+        updated = self._transition_status(
+            convocation_id,
+            [old_status],
+            {"status": ConvocationStatus.CANCELLED, "response_notes": cancellation_reason}
+        )
         
-        self.db.commit()
+        if not updated:
+            self.db.refresh(convocation)
+            return {"success": False, "error": f"Não é possível cancelar convocação com status {convocation.status.value}"}
         
         self._log_audit(
             action=AuditAction.CONVOCATION_CANCELLED,
             entity_type="convocation",
             entity_id=convocation_id,
             description=f"Convocação cancelada: {cancellation_reason}",
-            old_values={"status": old_status},
+            old_values={"status": old_status.value},
             new_values={"status": "cancelada", "reason": cancellation_reason}
         )
         
-        return {"success": True, "convocation": convocation}
+        self.db.commit()
+        
+        return {"success": True, "convocation": updated}
     
     def expire_pending_convocations(self) -> Dict:
         now = datetime.now()
         
-        expired = self.db.query(Convocation).filter(
-            Convocation.status == ConvocationStatus.PENDING,
-            Convocation.response_deadline < now
-        ).all()
+        # Um único UPDATE ... RETURNING: só as linhas que este UPDATE de fato
+        # expirou são auditadas e reescaladas (uma resposta concorrente fica de fora)
+        expired = self.db.execute(
+            update(Convocation).where(
+                Convocation.status == ConvocationStatus.PENDING,
+                Convocation.response_deadline < now
+            ).values(status=ConvocationStatus.EXPIRED).returning(Convocation)
+        ).scalars().all()
+        expired.sort(key=lambda c: c.id)
         
-        expired_count = 0
         reschedule_results = []
         
+        if expired:
+            self.db.bulk_insert_mappings(AuditLog, [
+                {
+                    "action": AuditAction.CONVOCATION_EXPIRED,
+                    "entity_type": "convocation",
+                    "entity_id": convocation.id,
+                    "description": f"Convocação expirada automaticamente (prazo: {convocation.response_deadline})",
+                    "new_values": {"status": "expirada"},
+                    "extra_data": {}
+                }
+                for convocation in expired
+            ])
+        
         for convocation in expired:
-            convocation.status = ConvocationStatus.EXPIRED
-            expired_count += 1
-            
-            self._log_audit(
-                action=AuditAction.CONVOCATION_EXPIRED,
-                entity_type="convocation",
-                entity_id=convocation.id,
-                description=f"Convocação expirada automaticamente (prazo: {convocation.response_deadline})",
-                new_values={"status": "expirada"}
-            )
-            
             reschedule_result = self.trigger_reschedule(convocation)
             reschedule_results.append(reschedule_result)
         
         self.db.commit()
         
         return {
-            "expired_count": expired_count,
+            "expired_count": len(expired),
             "reschedule_results": reschedule_results
         }
     
@@ -359,7 +528,7 @@ class ConvocationService:
             }
         )
         
-        eligible_employees = self._find_eligible_employees(
+        eligible_employees = self._iter_eligible_employees(
             sector_id=original_convocation.sector_id,
             activity_id=original_convocation.activity_id,
             conv_date=original_convocation.date,
@@ -369,15 +538,12 @@ class ConvocationService:
             exclude_employee_id=original_convocation.employee_id
         )
         
-        result["eligible_employees_found"] = len(eligible_employees)
-        
-        if not eligible_employees:
-            result["message"] = "Nenhum colaborador elegível encontrado para reescala"
-            return result
+        new_deadline = datetime.now() + timedelta(hours=72)
         
-        for employee in eligible_employees:
-            new_deadline = datetime.now() + timedelta(hours=72)
-            
+        # Para no primeiro candidato convocado com sucesso; eligible_employees_found
+        # conta os candidatos elegíveis efetivamente tentados
+        for employee, validation in eligible_employees:
+            result["eligible_employees_found"] += 1
             new_convocation, validation = self.create_convocation(
                 employee_id=employee.id,
                 sector_id=original_convocation.sector_id,
@@ -393,7 +559,9 @@ class ConvocationService:
                 generated_from=ConvocationOrigin.RESCHEDULE,
                 break_minutes=original_convocation.break_minutes,
                 operational_justification=f"Reescala automática (convocação original: {original_convocation.id})",
-                replaced_convocation_id=original_convocation.id
+                replaced_convocation_id=original_convocation.id,
+                skip_validation=True,
+                validation=validation
             )
             
             if new_convocation:
@@ -407,10 +575,14 @@ class ConvocationService:
             else:
                 result["errors"].append(f"Colaborador {employee.name}: {'; '.join(validation['errors'])}")
         
+        if not result["eligible_employees_found"]:
+            result["message"] = "Nenhum colaborador elegível encontrado para reescala"
+            return result
+        
         result["message"] = "Não foi possível criar convocação de reescala para nenhum colaborador elegível"
         return result
     
-    def _find_eligible_employees(
+    def _iter_eligible_employees(
         self,
         sector_id: int,
         activity_id: Optional[int],
@@ -419,7 +591,7 @@ class ConvocationService:
         end_time: time,
         total_hours: float,
         exclude_employee_id: int
-    ) -> List[Employee]:
+    ) -> Iterator[Tuple[Employee, Dict]]:
         query = self.db.query(Employee).filter(
             Employee.sector_id == sector_id,
             Employee.is_active == True,
@@ -428,32 +600,74 @@ class ConvocationService:
         )
         
         employees = query.all()
-        eligible = []
         
+        yield from self._bulk_validate_candidates(
+            employees=employees,
+            activity_id=activity_id,
+            conv_date=conv_date,
+            start_time=start_time,
+            total_hours=total_hours
+        )
+    
+    def _bulk_validate_candidates(
+        self,
+        employees: List[Employee],
+        activity_id: Optional[int],
+        conv_date: date,
+        start_time: time,
+        total_hours: float
+    ) -> Iterator[Tuple[Employee, Dict]]:
+        """
+        Aplica as mesmas regras de validate_convocation a vários candidatos
+        com consultas em lote, em vez de repetir as queries por colaborador.
+        Os candidatos já chegam filtrados (ativos, intermitentes, do setor).
+        Gera os elegíveis com a validação de cada um, começando pelos de
+        menor carga na semana.
+        """
+        if not employees:
+            return
+        
+        # Antecedência e jornada diária são iguais para todos os candidatos
+        static_result = self._apply_static_checks(
+            {"is_valid": True, "errors": [], "warnings": [], "checks": []},
+            conv_date, start_time, total_hours
+        )
+        if not static_result["is_valid"]:
+            return
+        
+        week_start = conv_date - timedelta(days=conv_date.weekday())
+        hours_by_week, busy_days = self._load_week_convocations(
+            [e.id for e in employees], week_start, week_start + timedelta(days=6)
+        )
+        
+        allowed_role_ids = None
+        if activity_id:
+            role_ids = {e.role_id for e in employees}
+            allowed_role_ids = {
+                row.role_id for row in self.db.query(RoleActivity.role_id).filter(
+                    RoleActivity.activity_id == activity_id,
+                    RoleActivity.is_active == True,
+                    RoleActivity.role_id.in_(role_ids)
+                ).all()
+            }
+        
+        employees = sorted(employees, key=lambda e: hours_by_week.get((e.id, week_start), 0))
         for employee in employees:
-            validation = self.validate_convocation(
-                employee_id=employee.id,
-                sector_id=sector_id,
+            if allowed_role_ids is not None and employee.role_id not in allowed_role_ids:
+                continue
+            
+            validation = {"is_valid": True, "errors": [], "warnings": [], "checks": []}
+            self._merge_static_checks(validation, static_result)
+            self._apply_history_checks(
+                result=validation,
+                employee=employee,
                 conv_date=conv_date,
-                start_time=start_time,
-                end_time=end_time,
-                total_hours=total_hours
+                total_hours=total_hours,
+                existing_weekly_hours=hours_by_week.get((employee.id, week_start), 0),
+                has_same_day_convocation=(employee.id, conv_date) in busy_days
             )
-            
             if validation["is_valid"]:
-                if activity_id:
-                    can_do_activity = self.db.query(RoleActivity).filter(
-                        RoleActivity.role_id == employee.role_id,
-                        RoleActivity.activity_id == activity_id,
-                        RoleActivity.is_active == True
-                    ).first()
-                    
-                    if can_do_activity:
-                        eligible.append(employee)
-                else:
-                    eligible.append(employee)
-        
-        return eligible
+                yield employee, validation
     
     def generate_convocations_from_schedule(
         self,
@@ -491,32 +705,39 @@ class ConvocationService:
         
         response_deadline = datetime.now() + timedelta(hours=response_deadline_hours)
         
+        covered_shift_ids = {
+            row.daily_shift_id for row in self.db.query(Convocation.daily_shift_id).filter(
+                Convocation.daily_shift_id.in_([shift.id for shift in shifts])
+            ).all()
+        }
+        
+        pending_shifts = []
+        specs = []
         for shift in shifts:
-            existing = self.db.query(Convocation).filter(
-                Convocation.daily_shift_id == shift.id
-            ).first()
-            
-            if existing:
+            if shift.id in covered_shift_ids:
                 result["warnings"].append(f"Turno {shift.id} já possui convocação")
                 continue
             
-            convocation, validation = self.create_convocation(
-                employee_id=shift.employee_id,
-                sector_id=schedule.sector_id,
-                conv_date=shift.date,
-                start_time=shift.start_time,
-                end_time=shift.end_time,
-                total_hours=shift.planned_hours,
-                response_deadline=response_deadline,
-                activity_id=None,
-                daily_shift_id=shift.id,
-                weekly_schedule_id=weekly_schedule_id,
-                generated_from=ConvocationOrigin.BASELINE
-            )
-            
-            if convocation:
+            pending_shifts.append(shift)
+            specs.append({
+                "employee_id": shift.employee_id,
+                "sector_id": schedule.sector_id,
+                "conv_date": shift.date,
+                "start_time": shift.start_time,
+                "end_time": shift.end_time,
+                "total_hours": shift.planned_hours,
+                "response_deadline": response_deadline,
+                "daily_shift_id": shift.id,
+                "weekly_schedule_id": weekly_schedule_id,
+                "generated_from": ConvocationOrigin.BASELINE
+            })
+        
+        created = self._create_convocations_bulk(specs)
+        
+        for shift, (convocation_id, validation) in zip(pending_shifts, created):
+            if convocation_id:
                 result["convocations_created"] += 1
-                result["created_convocation_ids"].append(convocation.id)
+                result["created_convocation_ids"].append(convocation_id)
             else:
                 result["convocations_blocked"] += 1
                 result["errors"].append(
@@ -528,12 +749,144 @@ class ConvocationService:
         
         return result
     
+    def _create_convocations_bulk(self, specs: List[Dict]) -> List[Tuple[Optional[int], Dict]]:
+        """
+        Valida e insere várias convocações de uma vez (mesmas regras de
+        create_convocation). Cada spec usa os nomes de argumento de
+        create_convocation. Retorna (id criado ou None, validação) na ordem
+        das specs; as convocações aceitas no lote contam para as seguintes.
+        """
+        if not specs:
+            return []
+        
+        employee_ids = list({spec["employee_id"] for spec in specs})
+        employees = {
+            e.id: e for e in self.db.query(Employee).filter(Employee.id.in_(employee_ids)).all()
+        }
+        
+        conv_dates = [spec["conv_date"] for spec in specs]
+        first_date, last_date = min(conv_dates), max(conv_dates)
+        hours_by_week, busy_days = self._load_week_convocations(
+            employee_ids,
+            first_date - timedelta(days=first_date.weekday()),
+            last_date + timedelta(days=6 - last_date.weekday())
+        )
+        
+        now = datetime.now()
+        static_results: Dict[Tuple[date, time, float], Dict] = {}
+        validations = []
+        rows = []
+        for spec in specs:
+            employee_id = spec["employee_id"]
+            conv_date = spec["conv_date"]
+            validation = {"is_valid": True, "errors": [], "warnings": [], "checks": []}
+            validations.append(validation)
+            
+            employee = employees.get(employee_id)
+            if not employee:
+                validation["is_valid"] = False
+                validation["errors"].append(f"Colaborador {employee_id} não encontrado")
+                continue
+            if not self._check_employee(employee, spec["sector_id"], validation):
+                continue
+            
+            static_key = (conv_date, spec["start_time"], spec["total_hours"])
+            if static_key not in static_results:
+                static_results[static_key] = self._apply_static_checks(
+                    {"is_valid": True, "errors": [], "warnings": [], "checks": []},
+                    conv_date, spec["start_time"], spec["total_hours"], now
+                )
+            self._merge_static_checks(validation, static_results[static_key])
+            
+            week_key = (employee_id, conv_date - timedelta(days=conv_date.weekday()))
+            self._apply_history_checks(
+                result=validation,
+                employee=employee,
+                conv_date=conv_date,
+                total_hours=spec["total_hours"],
+                existing_weekly_hours=hours_by_week.get(week_key, 0),
+                has_same_day_convocation=(employee_id, conv_date) in busy_days
+            )
+            if not validation["is_valid"]:
+                continue
+            
+            hours_by_week[week_key] = hours_by_week.get(week_key, 0) + spec["total_hours"]
+            busy_days.add((employee_id, conv_date))
+            rows.append({
+                "employee_id": employee_id,
+                "sector_id": spec["sector_id"],
+                "activity_id": spec.get("activity_id"),
+                "daily_shift_id": spec.get("daily_shift_id"),
+                "weekly_schedule_id": spec.get("weekly_schedule_id"),
+                "forecast_run_id": spec.get("forecast_run_id"),
+                "date": conv_date,
+                "start_time": spec["start_time"],
+                "end_time": spec["end_time"],
+                "break_minutes": spec.get("break_minutes", 60),
+                "total_hours": spec["total_hours"],
+                "status": ConvocationStatus.PENDING,
+                "generated_from": spec["generated_from"],
+                "response_deadline": spec["response_deadline"],
+                "sent_at": now,
+                "operational_justification": spec.get("operational_justification"),
+                "replaced_convocation_id": spec.get("replaced_convocation_id"),
+                "legal_validation_passed": True,
+                "legal_validation_errors": None,
+                "legal_validation_warnings": "; ".join(validation["warnings"]) if validation["warnings"] else None
+            })
+        
+        created_ids = self.db.execute(
+            insert(Convocation).returning(Convocation.id, sort_by_parameter_order=True),
+            rows
+        ).scalars().all() if rows else []
+        
+        if created_ids:
+            # Datas e prazos se repetem entre as linhas: formata cada valor uma vez
+            iso_values = {
+                value: value.isoformat()
+                for value in {row["date"] for row in rows} | {row["response_deadline"] for row in rows}
+            }
+            self.db.bulk_insert_mappings(AuditLog, [
+                {
+                    "action": AuditAction.CONVOCATION_CREATED,
+                    "entity_type": "convocation",
+                    "entity_id": convocation_id,
+                    "description": f"Convocação criada para colaborador {row['employee_id']} em {row['date']}",
+                    "new_values": {
+                        "employee_id": row["employee_id"],
+                        "sector_id": row["sector_id"],
+                        "date": iso_values[row["date"]],
+                        "total_hours": row["total_hours"],
+                        "generated_from": row["generated_from"].value,
+                        "response_deadline": iso_values[row["response_deadline"]]
+                    },
+                    "extra_data": {}
+                }
+                for convocation_id, row in zip(created_ids, rows)
+            ])
+        
+        created_iter = iter(created_ids)
+        return [
+            (next(created_iter) if validation["is_valid"] else None, validation)
+            for validation in validations
+        ]
+    
     def get_convocation_stats(
         self,
         sector_id: Optional[int] = None,
         week_start: Optional[date] = None
     ) -> Dict:
-        query = self.db.query(Convocation)
+        def count_status(status: ConvocationStatus):
+            return func.coalesce(func.sum(case((Convocation.status == status, 1), else_=0)), 0)
+        
+        query = self.db.query(
+            func.count(Convocation.id),
+            count_status(ConvocationStatus.PENDING),
+            count_status(ConvocationStatus.ACCEPTED),
+            count_status(ConvocationStatus.DECLINED),
+            count_status(ConvocationStatus.EXPIRED),
+            count_status(ConvocationStatus.CANCELLED)
+        )
         
         if sector_id:
             query = query.filter(Convocation.sector_id == sector_id)
@@ -545,14 +898,7 @@ class ConvocationService:
                 Convocation.date <= week_end
             )
         
-        convocations = query.all()
-        
-        total = len(convocations)
-        pending = sum(1 for c in convocations if c.status == ConvocationStatus.PENDING)
-        accepted = sum(1 for c in convocations if c.status == ConvocationStatus.ACCEPTED)
-        declined = sum(1 for c in convocations if c.status == ConvocationStatus.DECLINED)
-        expired = sum(1 for c in convocations if c.status == ConvocationStatus.EXPIRED)
-        cancelled = sum(1 for c in convocations if c.status == ConvocationStatus.CANCELLED)
+        total, pending, accepted, declined, expired, cancelled = query.one()
         
         responded = accepted + declined
         acceptance_rate = (accepted / responded * 100) if responded > 0 else 0.0
@@ -577,14 +923,13 @@ class ConvocationService:
         new_values: Optional[Dict] = None,
         extra_data: Optional[Dict] = None
     ):
-        import json
         audit = AuditLog(
             action=action,
             entity_type=entity_type,
             entity_id=entity_id,
             description=description,
-            old_values=json.dumps(old_values) if old_values else None,
-            new_values=json.dumps(new_values) if new_values else None,
+            old_values=old_values or None,
+            new_values=new_values or None,
             extra_data=extra_data or {}
         )
         self.db.add(audit)
@@ -1,7 +1,9 @@
+import threading
+import time
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from app.models.governance_module import (
     SectorOperationalParameters, ForecastRun, ForecastDaily,
@@ -21,6 +23,21 @@ WEEKDAYS_PT = {
     6: "DOMINGO"
 }
 
+# Limiar de replanejamento vigente por setor: {sector_id: (expira_em, threshold_pp)}.
+# Parâmetros mudam raramente; TTL curto limita defasagem entre workers.
+THRESHOLD_CACHE_TTL_SECONDS = 60.0
+_threshold_cache: Dict[int, Tuple[float, float]] = {}
+_threshold_cache_lock = threading.Lock()
+
+
+def invalidate_sector_parameters_cache(sector_id: Optional[int] = None) -> None:
+    """Descarta o limiar em cache do setor (ou de todos) após alteração de parâmetros."""
+    with _threshold_cache_lock:
+        if sector_id is None:
+            _threshold_cache.clear()
+        else:
+            _threshold_cache.pop(sector_id, None)
+
 
 class DailyReplanService:
     
@@ -52,13 +69,11 @@ class DailyReplanService:
         }
         
         try:
-            params = self._get_sector_parameters(sector_id)
-            if not params:
+            threshold = self._get_replan_threshold(sector_id)
+            if threshold is None:
                 result["errors"].append(f"Parâmetros não encontrados para setor {sector_id}")
                 return result
             
-            threshold = params.replan_threshold_pp or 5.0
-            
             schedule_plan = self._get_active_schedule_plan(sector_id, date_today)
             if not schedule_plan:
                 result["errors"].append("Nenhuma escala ativa encontrada para a semana")
@@ -68,15 +83,17 @@ class DailyReplanService:
                 result["errors"].append("Escala não possui forecast associado")
                 return result
             
-            original_forecasts = self.db.query(ForecastDaily).filter(
-                ForecastDaily.forecast_run_id == schedule_plan.forecast_run_id,
-                ForecastDaily.target_date >= date_today
-            ).all()
+            rows = self._load_forecasts_with_latest(
+                schedule_plan.id,
+                schedule_plan.forecast_run_id,
+                date_today
+            )
             
             suggestions = []
+            new_rows = []
             
-            for original in original_forecasts:
-                current_occ = self._get_current_occupancy(original.target_date)
+            for original, latest, pending in rows:
+                current_occ = self._occupancy_value(latest)
                 
                 if current_occ is None:
                     continue
@@ -85,11 +102,7 @@ class DailyReplanService:
                 delta = current_occ - original_adj
                 
                 if abs(delta) >= threshold:
-                    existing = self._check_existing_suggestion(
-                        schedule_plan.id, 
-                        original.target_date,
-                        current_occ
-                    )
+                    existing = pending if self._is_similar_suggestion(pending, current_occ) else None
                     
                     if existing:
                         suggestions.append({
@@ -105,7 +118,7 @@ class DailyReplanService:
                         })
                         continue
                     
-                    suggestion = self._create_suggestion(
+                    suggestion = self._build_suggestion_row(
                         schedule_plan_id=schedule_plan.id,
                         target_date=original.target_date,
                         original_value=original_adj,
@@ -114,7 +127,7 @@ class DailyReplanService:
                         threshold=threshold
                     )
                     
-                    self.db.add(suggestion)
+                    new_rows.append(suggestion)
                     
                     suggestions.append({
                         "target_date": original.target_date.isoformat(),
@@ -122,12 +135,14 @@ class DailyReplanService:
                         "original_occ_adj": round(original_adj, 2),
                         "current_occ": round(current_occ, 2),
                         "delta_pp": round(delta, 2),
-                        "suggestion_type": suggestion.suggestion_type,
-                        "reason": suggestion.reason,
-                        "priority": suggestion.priority,
+                        "suggestion_type": suggestion["suggestion_type"],
+                        "reason": suggestion["reason"],
+                        "priority": suggestion["priority"],
                         "status": "new"
                     })
             
+            if new_rows:
+                self.db.bulk_insert_mappings(ReplanSuggestion, new_rows)
             self.db.commit()
             
             result["suggestions"] = suggestions
@@ -154,6 +169,26 @@ class DailyReplanService:
             SectorOperationalParameters.is_current == True
         ).first()
     
+    def _get_replan_threshold(self, sector_id: int) -> Optional[float]:
+        """
+        Limiar (pp) dos parâmetros vigentes do setor, com cache em processo.
+        Retorna None se o setor não tiver parâmetros (ausência não é cacheada).
+        """
+        now = time.monotonic()
+        with _threshold_cache_lock:
+            cached = _threshold_cache.get(sector_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        params = self._get_sector_parameters(sector_id)
+        if not params:
+            return None
+        
+        threshold = params.replan_threshold_pp or 5.0
+        with _threshold_cache_lock:
+            _threshold_cache[sector_id] = (now + THRESHOLD_CACHE_TTL_SECONDS, threshold)
+        return threshold
+    
     def _get_active_schedule_plan(self, sector_id: int, date_ref: date) -> Optional[HousekeepingSchedulePlan]:
         """Obtém escala ativa que cobre a data de referência."""
         return self.db.query(HousekeepingSchedulePlan).filter(
@@ -162,6 +197,46 @@ class DailyReplanService:
             HousekeepingSchedulePlan.week_end >= date_ref
         ).order_by(HousekeepingSchedulePlan.created_at.desc()).first()
     
+    def _load_forecasts_with_latest(
+        self,
+        schedule_plan_id: int,
+        forecast_run_id: int,
+        date_from: date
+    ) -> List[Tuple[ForecastDaily, Optional[OccupancyLatest], Optional[ReplanSuggestion]]]:
+        """
+        Carrega em uma única query o forecast original de cada dia junto com a
+        ocupação mais recente e a última sugestão pendente da escala para a data.
+        """
+        latest_pending_id = select(ReplanSuggestion.id).where(
+            ReplanSuggestion.schedule_plan_id == schedule_plan_id,
+            ReplanSuggestion.target_date == ForecastDaily.target_date,
+            ReplanSuggestion.is_accepted.is_(None)
+        ).order_by(
+            ReplanSuggestion.created_at.desc(),
+            ReplanSuggestion.id.desc()
+        ).limit(1).correlate(ForecastDaily).scalar_subquery()
+        
+        return self.db.query(ForecastDaily, OccupancyLatest, ReplanSuggestion).outerjoin(
+            OccupancyLatest,
+            OccupancyLatest.target_date == ForecastDaily.target_date
+        ).outerjoin(
+            ReplanSuggestion,
+            ReplanSuggestion.id == latest_pending_id
+        ).filter(
+            ForecastDaily.forecast_run_id == forecast_run_id,
+            ForecastDaily.target_date >= date_from
+        ).order_by(ForecastDaily.target_date).all()
+    
+    @staticmethod
+    def _is_similar_suggestion(
+        suggestion: Optional[ReplanSuggestion],
+        current_value: float
+    ) -> bool:
+        """Sugestão pendente com valor próximo ao atual (cenário sem mudança significativa)."""
+        if suggestion is None or suggestion.suggested_value is None:
+            return False
+        return abs(suggestion.suggested_value - current_value) < 2.0
+    
     def _check_existing_suggestion(
         self, 
         schedule_plan_id: int, 
@@ -178,10 +253,8 @@ class DailyReplanService:
             ReplanSuggestion.is_accepted.is_(None)
         ).order_by(ReplanSuggestion.created_at.desc()).first()
         
-        if existing:
-            value_diff = abs(existing.suggested_value - current_value)
-            if value_diff < 2.0:
-                return existing
+        if self._is_similar_suggestion(existing, current_value):
+            return existing
         
         return None
     
@@ -191,6 +264,11 @@ class DailyReplanService:
             OccupancyLatest.target_date == target_date
         ).first()
         
+        return self._occupancy_value(latest)
+    
+    @staticmethod
+    def _occupancy_value(latest: Optional[OccupancyLatest]) -> Optional[float]:
+        """Ocupação a considerar: projeção mais recente ou, na falta, a ocupação consolidada."""
         if not latest:
             return None
         
@@ -199,7 +277,7 @@ class DailyReplanService:
         
         return latest.occupancy_pct
     
-    def _create_suggestion(
+    def _build_suggestion_row(
         self,
         schedule_plan_id: int,
         target_date: date,
@@ -207,8 +285,8 @@ class DailyReplanService:
         current_value: float,
         delta: float,
         threshold: float
-    ) -> ReplanSuggestion:
-        """Cria sugestão de ajuste."""
+    ) -> Dict:
+        """Monta os valores da sugestão de ajuste para inserção em lote."""
         if delta > 0:
             suggestion_type = "INCREASE_HEADCOUNT"
             reason = f"Ocupação aumentou {delta:.1f}pp desde a geração da escala. Considere adicionar mais camareiras."
@@ -223,23 +301,23 @@ class DailyReplanService:
         else:
             priority = "low"
         
-        return ReplanSuggestion(
-            schedule_plan_id=schedule_plan_id,
-            target_date=target_date,
-            suggestion_type=suggestion_type,
-            original_value=original_value,
-            suggested_value=current_value,
-            delta=delta,
-            reason=reason,
-            priority=priority,
-            justification_json={
+        return {
+            "schedule_plan_id": schedule_plan_id,
+            "target_date": target_date,
+            "suggestion_type": suggestion_type,
+            "original_value": original_value,
+            "suggested_value": current_value,
+            "delta": delta,
+            "reason": reason,
+            "priority": priority,
+            "justification_json": {
                 "threshold_pp": threshold,
                 "delta_pp": delta,
                 "original_occ_adj": original_value,
                 "current_occ": current_value,
                 "method_version": METHOD_VERSION
             }
-        )
+        }
     
     def accept_suggestion(self, suggestion_id: int, accepted_by: str = None) -> Dict:
         """Marca sugestão como aceita."""
@@ -285,29 +363,32 @@ class DailyReplanService:
     
     def get_pending_suggestions(self, sector_id: int) -> List[Dict]:
         """Lista sugestões pendentes do setor."""
-        plans = self.db.query(HousekeepingSchedulePlan.id).filter(
-            HousekeepingSchedulePlan.sector_id == sector_id
-        ).subquery()
-        
-        suggestions = self.db.query(ReplanSuggestion).filter(
-            ReplanSuggestion.schedule_plan_id.in_(plans),
+        rows = self.db.query(
+            ReplanSuggestion.id,
+            ReplanSuggestion.target_date,
+            ReplanSuggestion.suggestion_type,
+            ReplanSuggestion.original_value,
+            ReplanSuggestion.suggested_value,
+            ReplanSuggestion.delta,
+            ReplanSuggestion.reason,
+            ReplanSuggestion.priority,
+            ReplanSuggestion.created_at
+        ).join(
+            HousekeepingSchedulePlan,
+            HousekeepingSchedulePlan.id == ReplanSuggestion.schedule_plan_id
+        ).filter(
+            HousekeepingSchedulePlan.sector_id == sector_id,
             ReplanSuggestion.is_accepted.is_(None)
         ).order_by(
             ReplanSuggestion.target_date,
             ReplanSuggestion.priority.desc()
         ).all()
         
-        return [
-            {
-                "id": s.id,
-                "target_date": s.target_date.isoformat(),
-                "suggestion_type": s.suggestion_type,
-                "original_value": s.original_value,
-                "suggested_value": s.suggested_value,
-                "delta": s.delta,
-                "reason": s.reason,
-                "priority": s.priority,
-                "created_at": s.created_at.isoformat() if s.created_at else None
-            }
-            for s in suggestions
-        ]
+        suggestions = []
+        for row in rows:
+            item = row._asdict()
+            item["target_date"] = row.target_date.isoformat()
+            item["created_at"] = row.created_at.isoformat() if row.created_at else None
+            suggestions.append(item)
+        
+        return suggestions
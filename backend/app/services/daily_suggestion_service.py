@@ -1,6 +1,6 @@
 from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, raiseload
 from sqlalchemy import and_, func
 from app.models import (
     DailySuggestion, SuggestionType, SuggestionStatus, SuggestionImpactCategory,
@@ -296,8 +296,16 @@ class DailySuggestionService:
         status: Optional[SuggestionStatus] = None,
         limit: int = 50
     ) -> List[DailySuggestion]:
-        """Lista sugestões com filtros."""
-        query = db.query(DailySuggestion)
+        """
+        Lista sugestões com filtros.
+        
+        O setor vem no mesmo SELECT; qualquer outro relacionamento acessado na
+        serialização levanta erro em vez de disparar uma query por linha.
+        """
+        query = db.query(DailySuggestion).options(
+            joinedload(DailySuggestion.sector).load_only(Sector.id, Sector.name),
+            raiseload("*")
+        )
         
         if sector_id:
             query = query.filter(DailySuggestion.sector_id == sector_id)
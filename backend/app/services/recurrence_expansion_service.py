@@ -8,11 +8,11 @@ em uma determinada semana, baseado em sua periodicidade e data de
 from datetime import date, timedelta
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from app.models.governance_activity import GovernanceActivity, ActivityClassification
 from app.models.activity_periodicity import ActivityPeriodicity
-from app.models.activity_program import ActivityProgramWeek, ActivityProgramItem
+from app.models.activity_program import ActivityProgramItem
 
 
 def get_week_dates(year: int, week: int) -> tuple[date, date]:
@@ -35,22 +35,10 @@ def find_last_execution_date(
     Encontra a última data em que a atividade foi programada.
     Busca nos itens de programação anteriores à data especificada.
     """
-    last_item = db.query(ActivityProgramItem).join(
-        ActivityProgramWeek,
-        ActivityProgramItem.program_week_id == ActivityProgramWeek.id
-    ).filter(
+    return db.query(func.max(ActivityProgramItem.op_date)).filter(
         ActivityProgramItem.activity_id == activity_id,
-        ActivityProgramWeek.week_start_date < before_date
-    ).order_by(ActivityProgramWeek.week_start_date.desc()).first()
-    
-    if last_item:
-        program_week = db.query(ActivityProgramWeek).filter(
-            ActivityProgramWeek.id == last_item.program_week_id
-        ).first()
-        if program_week:
-            return program_week.week_start_date + timedelta(days=last_item.weekday)
-    
-    return None
+        ActivityProgramItem.op_date < before_date
+    ).scalar()
 
 
 def should_execute_this_week(
@@ -199,15 +199,22 @@ def aplicar_ajustes_com_regras(
 def obter_atividades_programacao(
     db: Session,
     setor_id: int,
-    contexto: Dict[str, Any]
+    contexto: Dict[str, Any],
+    regras: Optional[List[RegraCalculoSetor]] = None,
+    atividades_ativas: Optional[Dict[int, GovernanceActivity]] = None
 ) -> List[Dict[str, Any]]:
     """
     Determina quais atividades CALCULADAS_PELO_AGENTE devem ser inseridas
     na programação semanal baseado nas regras de PROGRAMACAO.
     
+    `regras` (de PROGRAMACAO) e `atividades_ativas` (por id) permitem reaproveitar
+    o que já foi carregado quando a função é chamada para vários contextos,
+    como os 7 dias de uma semana.
+    
     Retorna lista de atividades com seus dados e origem (regra que determinou).
     """
-    regras = obter_regras_setor(db, setor_id, RegraEscopo.PROGRAMACAO)
+    if regras is None:
+        regras = obter_regras_setor(db, setor_id, RegraEscopo.PROGRAMACAO)
     
     atividades_programadas = []
     atividades_ids_inseridos = set()
@@ -217,10 +224,12 @@ def obter_atividades_programacao(
             atividade_id = executar_acao_programacao(regra.acao_json, db)
             
             if atividade_id and atividade_id not in atividades_ids_inseridos:
-                atividade = db.query(GovernanceActivity).filter(
-                    GovernanceActivity.id == atividade_id,
-                    GovernanceActivity.is_active == True
-                ).first()
+                atividade = atividades_ativas.get(atividade_id) if atividades_ativas else None
+                if atividade is None:
+                    atividade = db.query(GovernanceActivity).filter(
+                        GovernanceActivity.id == atividade_id,
+                        GovernanceActivity.is_active == True
+                    ).first()
                 
                 if atividade:
                     atividades_programadas.append({
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { weeklyParametersApi, WeeklyParameters, DayType, sectorsApi, Sector } from '../services/client';
+import { weeklyParametersApi, WeeklyParameters, DayParameters, DayType, sectorsApi, Sector } from '../services/client';
 
 const DIAS = [
   { key: 'seg', nome: 'Segunda-feira' },
@@ -17,6 +17,10 @@ const TIPOS_DIA: { value: DayType; label: string }[] = [
   { value: 'vespera_feriado', label: 'Véspera de Feriado' },
 ];
 
+function emptyDays(): DayParameters[] {
+  return DIAS.map(() => ({ ocupacao_prevista: 0, quartos_vagos_sujos: 0, quartos_estada: 0, tipo_dia: 'normal' }));
+}
+
 function getNextMonday(): string {
   const today = new Date();
   const day = today.getDay();
@@ -39,13 +43,7 @@ export default function WeeklyParametersPage() {
   const [formData, setFormData] = useState<Partial<WeeklyParameters>>({
     sector_id: undefined,
     semana_inicio: getNextMonday(),
-    seg_ocupacao_prevista: 0, seg_quartos_vagos_sujos: 0, seg_quartos_estada: 0, seg_tipo_dia: 'normal',
-    ter_ocupacao_prevista: 0, ter_quartos_vagos_sujos: 0, ter_quartos_estada: 0, ter_tipo_dia: 'normal',
-    qua_ocupacao_prevista: 0, qua_quartos_vagos_sujos: 0, qua_quartos_estada: 0, qua_tipo_dia: 'normal',
-    qui_ocupacao_prevista: 0, qui_quartos_vagos_sujos: 0, qui_quartos_estada: 0, qui_tipo_dia: 'normal',
-    sex_ocupacao_prevista: 0, sex_quartos_vagos_sujos: 0, sex_quartos_estada: 0, sex_tipo_dia: 'normal',
-    sab_ocupacao_prevista: 0, sab_quartos_vagos_sujos: 0, sab_quartos_estada: 0, sab_tipo_dia: 'normal',
-    dom_ocupacao_prevista: 0, dom_quartos_vagos_sujos: 0, dom_quartos_estada: 0, dom_tipo_dia: 'normal',
+    days: emptyDays(),
   });
 
   useEffect(() => {
@@ -126,13 +124,7 @@ export default function WeeklyParametersPage() {
     setFormData({
       sector_id: selectedSectorId || undefined,
       semana_inicio: getNextMonday(),
-      seg_ocupacao_prevista: 0, seg_quartos_vagos_sujos: 0, seg_quartos_estada: 0, seg_tipo_dia: 'normal',
-      ter_ocupacao_prevista: 0, ter_quartos_vagos_sujos: 0, ter_quartos_estada: 0, ter_tipo_dia: 'normal',
-      qua_ocupacao_prevista: 0, qua_quartos_vagos_sujos: 0, qua_quartos_estada: 0, qua_tipo_dia: 'normal',
-      qui_ocupacao_prevista: 0, qui_quartos_vagos_sujos: 0, qui_quartos_estada: 0, qui_tipo_dia: 'normal',
-      sex_ocupacao_prevista: 0, sex_quartos_vagos_sujos: 0, sex_quartos_estada: 0, sex_tipo_dia: 'normal',
-      sab_ocupacao_prevista: 0, sab_quartos_vagos_sujos: 0, sab_quartos_estada: 0, sab_tipo_dia: 'normal',
-      dom_ocupacao_prevista: 0, dom_quartos_vagos_sujos: 0, dom_quartos_estada: 0, dom_tipo_dia: 'normal',
+      days: emptyDays(),
     });
     setEditingId(null);
     setShowForm(false);
@@ -144,10 +136,10 @@ export default function WeeklyParametersPage() {
     return sector ? sector.nome : 'Desconhecido';
   };
 
-  const updateDayField = (dia: string, campo: string, valor: any) => {
+  const updateDayField = (index: number, campo: keyof DayParameters, valor: any) => {
     setFormData(prev => ({
       ...prev,
-      [`${dia}_${campo}`]: valor
+      days: (prev.days || emptyDays()).map((dia, i) => i === index ? { ...dia, [campo]: valor } : dia)
     }));
   };
 
@@ -208,7 +200,7 @@ export default function WeeklyParametersPage() {
                 </tr>
               </thead>
               <tbody>
-                {DIAS.map(dia => (
+                {DIAS.map((dia, index) => (
                   <tr key={dia.key}>
                     <td><strong>{dia.nome}</strong></td>
                     <td>
@@ -217,8 +209,8 @@ export default function WeeklyParametersPage() {
                         min="0"
                         max="100"
                         step="0.1"
-                        value={(formData as any)[`${dia.key}_ocupacao_prevista`] || 0}
-                        onChange={e => updateDayField(dia.key, 'ocupacao_prevista', parseFloat(e.target.value) || 0)}
+                        value={formData.days?.[index]?.ocupacao_prevista || 0}
+                        onChange={e => updateDayField(index, 'ocupacao_prevista', parseFloat(e.target.value) || 0)}
                         style={{ width: '80px' }}
                       />
                     </td>
@@ -226,8 +218,8 @@ export default function WeeklyParametersPage() {
                       <input
                         type="number"
                         min="0"
-                        value={(formData as any)[`${dia.key}_quartos_vagos_sujos`] || 0}
-                        onChange={e => updateDayField(dia.key, 'quartos_vagos_sujos', parseInt(e.target.value) || 0)}
+                        value={formData.days?.[index]?.quartos_vagos_sujos || 0}
+                        onChange={e => updateDayField(index, 'quartos_vagos_sujos', parseInt(e.target.value) || 0)}
                         style={{ width: '80px' }}
                       />
                     </td>
@@ -235,15 +227,15 @@ export default function WeeklyParametersPage() {
                       <input
                         type="number"
                         min="0"
-                        value={(formData as any)[`${dia.key}_quartos_estada`] || 0}
-                        onChange={e => updateDayField(dia.key, 'quartos_estada', parseInt(e.target.value) || 0)}
+                        value={formData.days?.[index]?.quartos_estada || 0}
+                        onChange={e => updateDayField(index, 'quartos_estada', parseInt(e.target.value) || 0)}
                         style={{ width: '80px' }}
                       />
                     </td>
                     <td>
                       <select
-                        value={(formData as any)[`${dia.key}_tipo_dia`] || 'normal'}
-                        onChange={e => updateDayField(dia.key, 'tipo_dia', e.target.value)}
+                        value={formData.days?.[index]?.tipo_dia || 'normal'}
+                        onChange={e => updateDayField(index, 'tipo_dia', e.target.value)}
                       >
                         {TIPOS_DIA.map(tipo => (
                           <option key={tipo.value} value={tipo.value}>{tipo.label}</option>
@@ -283,9 +275,9 @@ export default function WeeklyParametersPage() {
             </thead>
             <tbody>
               {parametrosList.map(params => {
-                const totalVS = DIAS.reduce((sum, d) => sum + ((params as any)[`${d.key}_quartos_vagos_sujos`] || 0), 0);
-                const totalEstada = DIAS.reduce((sum, d) => sum + ((params as any)[`${d.key}_quartos_estada`] || 0), 0);
-                const feriados = DIAS.filter(d => (params as any)[`${d.key}_tipo_dia`] !== 'normal').length;
+                const totalVS = params.days.reduce((sum, d) => sum + (d.quartos_vagos_sujos || 0), 0);
+                const totalEstada = params.days.reduce((sum, d) => sum + (d.quartos_estada || 0), 0);
+                const feriados = params.days.filter(d => d.tipo_dia !== 'normal').length;
                 
                 return (
                   <tr key={params.id}>
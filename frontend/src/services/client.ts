@@ -54,38 +54,18 @@ export interface Employee {
 
 export type DayType = 'normal' | 'feriado' | 'vespera_feriado';
 
+export interface DayParameters {
+  ocupacao_prevista: number;
+  quartos_vagos_sujos: number;
+  quartos_estada: number;
+  tipo_dia: DayType;
+}
+
 export interface WeeklyParameters {
   id: number;
   sector_id?: number;
   semana_inicio: string;
-  seg_ocupacao_prevista: number;
-  seg_quartos_vagos_sujos: number;
-  seg_quartos_estada: number;
-  seg_tipo_dia: DayType;
-  ter_ocupacao_prevista: number;
-  ter_quartos_vagos_sujos: number;
-  ter_quartos_estada: number;
-  ter_tipo_dia: DayType;
-  qua_ocupacao_prevista: number;
-  qua_quartos_vagos_sujos: number;
-  qua_quartos_estada: number;
-  qua_tipo_dia: DayType;
-  qui_ocupacao_prevista: number;
-  qui_quartos_vagos_sujos: number;
-  qui_quartos_estada: number;
-  qui_tipo_dia: DayType;
-  sex_ocupacao_prevista: number;
-  sex_quartos_vagos_sujos: number;
-  sex_quartos_estada: number;
-  sex_tipo_dia: DayType;
-  sab_ocupacao_prevista: number;
-  sab_quartos_vagos_sujos: number;
-  sab_quartos_estada: number;
-  sab_tipo_dia: DayType;
-  dom_ocupacao_prevista: number;
-  dom_quartos_vagos_sujos: number;
-  dom_quartos_estada: number;
-  dom_tipo_dia: DayType;
+  days: DayParameters[];
   created_at: string;
   updated_at?: string;
 }